@@ -1,8 +1,36 @@
+import importlib
 
 
-# Import classes and functions from library
-from AlertManager.module import *
+# Public names and the submodules defining them. They are imported on first access, so that, for example,
+# using LocalValidator never imports SQLAlchemy and importing the package itself loads nothing heavy.
+_lazy_attributes = {
+    'LocalValidator': 'AlertManager.local',
+    'DatabaseValidator': 'AlertManager.database',
+    'LogStore': 'AlertManager.store',
+    'LogWriter': 'AlertManager.writer',
+    'ValidationScheduler': 'AlertManager.scheduler',
+}
+
+# Submodules available as attributes of the package, also imported on first access
+_lazy_submodules = ['local', 'database', 'module', 'backends', 'files', 'store', 'bitmap', 'writer', 'scheduler']
 
 
 # Make these modules available in the global scope
-__all__ = ['LocalValidator']
\ No newline at end of file
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    elif name in _lazy_submodules:
+        value = importlib.import_module(f'AlertManager.{name}')
+    else:
+        raise AttributeError(f"module 'AlertManager' has no attribute '{name}'")
+
+    # Cache the value so later accesses skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes) | set(_lazy_submodules))
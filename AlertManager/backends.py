@@ -0,0 +1,524 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+
+
+def _require(module, extra):
+    """
+    Imports an optional dependency, raising a helpful error if it is not installed.
+
+    Args:
+        module (str): The module to import.
+        extra (str): The name of the AlertManager extra that installs it.
+
+    Returns:
+        module: The imported module.
+
+    Raises:
+        ImportError: If the module is not installed.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"The '{extra}' backend requires '{module}'. "
+                          f"Install it with 'pip install AlertManager[{extra}]'.")
+
+
+class Backend:
+    """
+    Base class for the execution backends of LocalValidator.
+    A backend evaluates the checks on one kind of in-memory data and returns the offending rows in the same kind.
+    """
+
+    name = None
+
+    def accepts(self, data):
+        """
+        Returns True if the data can be validated by this backend without conversion.
+        """
+        raise NotImplementedError
+
+    def prepare(self, data):
+        """
+        Converts the data to the native type of this backend, if needed.
+        """
+        return data
+
+    def columns(self, data):
+        raise NotImplementedError
+
+    def num_rows(self, rows):
+        return len(rows)
+
+    def to_pandas(self, rows):
+        """
+        Converts offending rows to a pandas DataFrame for logging.
+        """
+        if isinstance(rows, pd.DataFrame):
+            return rows
+        return rows.to_pandas()
+
+    def out_of_range(self, data, column, borders):
+        raise NotImplementedError
+
+    def value_violations(self, data, column, allowed, not_allowed):
+        raise NotImplementedError
+
+    def is_numeric(self, data, column):
+        raise NotImplementedError
+
+    def dtype(self, data, column):
+        """
+        Returns the type of a column as a string, used to cache inferred data types.
+        """
+        raise NotImplementedError
+
+    def is_low_cardinality(self, data, column, max_ratio):
+        """
+        Returns True if the number of distinct values in a column is below max_ratio times the number of rows.
+        """
+        raise NotImplementedError
+
+    def zscore_outliers(self, data, column, threshold, group_by=None):
+        """
+        Returns the rows whose z-score exceeds the threshold, with mean and standard deviation per group if
+        group_by (a list of columns) is given.
+        """
+        raise NotImplementedError
+
+    def frequency_outliers(self, data, column, threshold_percentage, group_by=None):
+        """
+        Returns the rows whose value occurs in less than threshold_percentage of the rows, per group if group_by
+        (a list of columns) is given.
+        """
+        raise NotImplementedError
+
+    def query(self, data, custom_logic):
+        raise NotImplementedError
+
+    def select(self, data, invalid_rows):
+        """
+        Normalizes the result of a custom function (a mask or a subset of rows) to the offending rows.
+        """
+        raise NotImplementedError
+
+
+class PandasBackend(Backend):
+
+    name = "pandas"
+
+    def accepts(self, data):
+        return isinstance(data, pd.DataFrame)
+
+    def prepare(self, data):
+        if isinstance(data, pd.DataFrame):
+            return data
+        return data.to_pandas()
+
+    def columns(self, data):
+        return data.columns
+
+    def out_of_range(self, data, column, borders):
+        # Initialize a boolean Series to track whether values are within any of the specified ranges
+        in_range_mask = pd.Series(False, index=data.index)
+
+        # Iterate over the list of borders and update the mask for values within the range
+        for bottom, top in borders:
+            in_range_mask |= data[column].between(bottom, top)
+
+        # Identify rows where values are out of bounds
+        return data.loc[~in_range_mask].copy()
+
+    def value_violations(self, data, column, allowed, not_allowed):
+        # Initialize an empty DataFrame to store invalid rows
+        invalid_rows = pd.DataFrame()
+
+        # Validate against the allowed list, if provided
+        if allowed is not None:
+            invalid_rows_allowed = data[~data[column].isin(allowed)]
+            invalid_rows = pd.concat([invalid_rows, invalid_rows_allowed])
+
+        # Validate against the not allowed list, if provided
+        if not_allowed is not None:
+            invalid_rows_not_allowed = data[data[column].isin(not_allowed)]
+            invalid_rows = pd.concat([invalid_rows, invalid_rows_not_allowed])
+
+        return invalid_rows
+
+    def is_numeric(self, data, column):
+        return pd.api.types.is_numeric_dtype(data[column])
+
+    def dtype(self, data, column):
+        return str(data[column].dtype)
+
+    def is_low_cardinality(self, data, column, max_ratio):
+        values = data[column]
+        cutoff = max_ratio * len(values)
+
+        # The distinct count of a prefix is a lower bound for the whole column, so high-cardinality columns are
+        # settled by the first 2 * cutoff rows; the full count only runs when the prefix is inconclusive
+        prefix = values.iloc[:int(2 * cutoff) + 1]
+        if len(prefix) < len(values) and prefix.nunique() >= cutoff:
+            return False
+        return values.nunique() < cutoff
+
+    def zscore_outliers(self, data, column, threshold, group_by=None):
+        if group_by:
+            # Broadcast the statistics of each group back to its rows; null keys form their own group, like in SQL
+            grouped = data.groupby(group_by, dropna=False)[column]
+            mean = grouped.transform("mean")
+            std_dev = grouped.transform("std")
+        else:
+            mean = data[column].mean()
+            std_dev = data[column].std()
+        z_scores = np.abs((data[column] - mean) / std_dev)
+        return data[z_scores > threshold]
+
+    def frequency_outliers(self, data, column, threshold_percentage, group_by=None):
+        if group_by:
+            # Count each value and all non-null values within the group of every row; null keys form their own
+            # group, and null values are never outliers
+            frequency = data.groupby(group_by + [column], dropna=False)[column].transform("size")
+            total_counts = data.groupby(group_by, dropna=False)[column].transform("count")
+            return data[data[column].notna() & (frequency < total_counts * (threshold_percentage / 100.0))]
+
+        # Calculate frequency counts
+        frequency_counts = data[column].value_counts()
+        total_counts = frequency_counts.sum()
+        # Determine the threshold for low-frequency values
+        low_threshold_value = total_counts * (threshold_percentage / 100.0)
+        # Identify values that occur less frequently than the threshold
+        outlier_values = frequency_counts[frequency_counts < low_threshold_value].index.tolist()
+        # Filter out the rows containing these outlier values
+        return data[data[column].isin(outlier_values)]
+
+    def query(self, data, custom_logic):
+        return data.query(custom_logic)
+
+    def select(self, data, invalid_rows):
+        # Convert Series result to DataFrame for consistency
+        if isinstance(invalid_rows, pd.Series):
+            return data.loc[invalid_rows].copy()
+        if not isinstance(invalid_rows, pd.DataFrame):
+            raise TypeError("The custom function must return a pandas Series or DataFrame.")
+        return invalid_rows
+
+
+class ArrowBackend(Backend):
+    """
+    Evaluates the checks on a pyarrow.Table with Arrow compute kernels. Tables are used as they are, without copying.
+    """
+
+    name = "arrow"
+
+    def __init__(self):
+        self.pa = _require("pyarrow", "arrow")
+        self.pc = _require("pyarrow.compute", "arrow")
+
+    def accepts(self, data):
+        return isinstance(data, (self.pa.Table, self.pa.RecordBatch))
+
+    def prepare(self, data):
+        if isinstance(data, self.pa.Table):
+            return data
+        if isinstance(data, self.pa.RecordBatch):
+            return self.pa.Table.from_batches([data])
+        if isinstance(data, pd.DataFrame):
+            return self.pa.Table.from_pandas(data, preserve_index=False)
+        return data.to_arrow()
+
+    def columns(self, data):
+        return data.column_names
+
+    def num_rows(self, rows):
+        if isinstance(rows, pd.DataFrame):
+            return len(rows)
+        return rows.num_rows
+
+    def out_of_range(self, data, column, borders):
+        values = data[column]
+        in_range_mask = self.pa.scalar(False)
+        for bottom, top in borders:
+            in_range = self.pc.and_(self.pc.greater_equal(values, bottom), self.pc.less_equal(values, top))
+            in_range_mask = self.pc.or_(in_range_mask, in_range)
+
+        # Null values are never within a range
+        return data.filter(self.pc.invert(self.pc.fill_null(in_range_mask, False)))
+
+    def value_violations(self, data, column, allowed, not_allowed):
+        invalid_tables = []
+        if allowed is not None:
+            is_allowed = self.pc.is_in(data[column], value_set=self.pa.array(allowed))
+            invalid_tables.append(data.filter(self.pc.invert(is_allowed)))
+        if not_allowed is not None:
+            is_not_allowed = self.pc.is_in(data[column], value_set=self.pa.array(not_allowed))
+            invalid_tables.append(data.filter(is_not_allowed))
+
+        if not invalid_tables:
+            return data.slice(0, 0)
+        return self.pa.concat_tables(invalid_tables)
+
+    def is_numeric(self, data, column):
+        column_type = data.schema.field(column).type
+        return (self.pa.types.is_integer(column_type) or self.pa.types.is_floating(column_type)
+                or self.pa.types.is_decimal(column_type))
+
+    def dtype(self, data, column):
+        return str(data.schema.field(column).type)
+
+    def is_low_cardinality(self, data, column, max_ratio):
+        values = data[column]
+        cutoff = max_ratio * len(values)
+
+        # Same prefix shortcut as the pandas backend; slicing an Arrow column does not copy
+        prefix = values.slice(0, int(2 * cutoff) + 1)
+        if len(prefix) < len(values) and self.pc.count_distinct(prefix).as_py() >= cutoff:
+            return False
+        return self.pc.count_distinct(values).as_py() < cutoff
+
+    def _group_stats(self, data, group_by, aggregations):
+        """
+        Computes aggregations per group and broadcasts them back to the rows, in the original row order.
+        Only the group keys, the aggregated columns and a row index are grouped, so other columns may have any type
+        (a join would reject nested types). Null keys form their own group, like in SQL and Polars.
+
+        Returns:
+            list: One array per aggregation, aligned with the rows of the data.
+        """
+        pc = self.pc
+        columns = list(dict.fromkeys(group_by + [target for target, *_ in aggregations if target]))
+        narrow = data.select(columns).append_column("__row", self.pa.array(np.arange(data.num_rows)))
+        stats = narrow.group_by(group_by).aggregate(aggregations + [("__row", "list")])
+
+        # The row lists of all groups cover every row once; sorting them gives the group of each row in row order
+        rows = stats["__row_list"]
+        groups = pc.list_parent_indices(rows).take(pc.sort_indices(pc.list_flatten(rows)))
+
+        # Aggregated columns are named '<column>_<function>', or '<function>' for nullary aggregations
+        aggregated = [f"{target}_{function}" if target else function for target, function, *options in aggregations]
+        return [stats[name].take(groups) for name in aggregated]
+
+    def zscore_outliers(self, data, column, threshold, group_by=None):
+        if group_by:
+            # Broadcast the statistics of each group back to its rows
+            mean, std_dev = self._group_stats(data, group_by, [
+                (column, "mean"), (column, "stddev", self.pc.VarianceOptions(ddof=1))
+            ])
+            values = self.pc.cast(data[column], self.pa.float64())
+            z_scores = self.pc.abs(self.pc.divide(self.pc.subtract(values, mean), std_dev))
+            return data.filter(self.pc.greater(z_scores, threshold))
+
+        values = self.pc.cast(data[column], self.pa.float64())
+        mean = self.pc.mean(values)
+        std_dev = self.pc.stddev(values, ddof=1)
+        z_scores = self.pc.abs(self.pc.divide(self.pc.subtract(values, mean), std_dev))
+        return data.filter(self.pc.greater(z_scores, threshold))
+
+    def frequency_outliers(self, data, column, threshold_percentage, group_by=None):
+        if group_by:
+            # Count each value per group, then the non-null values per group; null values are never outliers
+            frequency, = self._group_stats(data, group_by + [column], [([], "count_all")])
+            total_counts, = self._group_stats(data, group_by, [(column, "count")])
+            low_threshold_value = self.pc.multiply(self.pc.cast(total_counts, self.pa.float64()),
+                                                   threshold_percentage / 100.0)
+            return data.filter(self.pc.and_(self.pc.is_valid(data[column]),
+                                            self.pc.less(frequency, low_threshold_value)))
+
+        # Calculate frequency counts, ignoring nulls like pandas value_counts
+        frequency_counts = self.pc.value_counts(data[column].drop_null())
+        counts = frequency_counts.field("counts")
+        low_threshold_value = self.pc.sum(counts).as_py() * (threshold_percentage / 100.0) if len(counts) else 0
+        outlier_values = frequency_counts.field("values").filter(self.pc.less(counts, low_threshold_value))
+        return data.filter(self.pc.fill_null(self.pc.is_in(data[column], value_set=outlier_values), False))
+
+    def query(self, data, custom_logic):
+        # Arrow has no expression parser, so query strings are evaluated on a pandas copy
+        return self.to_pandas(data).query(custom_logic)
+
+    def select(self, data, invalid_rows):
+        # Convert boolean masks to the selected rows for consistency
+        if isinstance(invalid_rows, (self.pa.Array, self.pa.ChunkedArray)):
+            return data.filter(invalid_rows)
+        if isinstance(invalid_rows, self.pa.RecordBatch):
+            return self.pa.Table.from_batches([invalid_rows])
+        if not isinstance(invalid_rows, self.pa.Table):
+            raise TypeError("The custom function must return a pyarrow boolean array or Table.")
+        return invalid_rows
+
+
+class PolarsBackend(Backend):
+    """
+    Evaluates the checks on Polars DataFrames or LazyFrames. Every check is a single lazy query, so only the
+    offending rows are materialized.
+    """
+
+    name = "polars"
+
+    def __init__(self):
+        self.pl = _require("polars", "polars")
+
+    def accepts(self, data):
+        return isinstance(data, (self.pl.DataFrame, self.pl.LazyFrame))
+
+    def prepare(self, data):
+        if isinstance(data, (self.pl.DataFrame, self.pl.LazyFrame)):
+            return data
+        return self.pl.from_pandas(data) if isinstance(data, pd.DataFrame) else self.pl.from_arrow(data)
+
+    def columns(self, data):
+        return data.lazy().collect_schema().names()
+
+    def _filter(self, data, condition):
+        return data.lazy().filter(condition).collect()
+
+    def out_of_range(self, data, column, borders):
+        pl = self.pl
+        in_range = pl.any_horizontal([pl.col(column).is_between(bottom, top) for bottom, top in borders])
+        return self._filter(data, ~in_range.fill_null(False))
+
+    def value_violations(self, data, column, allowed, not_allowed):
+        pl = self.pl
+        invalid_frames = []
+        if allowed is not None:
+            invalid_frames.append(self._filter(data, ~pl.col(column).is_in(allowed).fill_null(False)))
+        if not_allowed is not None:
+            invalid_frames.append(self._filter(data, pl.col(column).is_in(not_allowed).fill_null(False)))
+
+        if not invalid_frames:
+            return data.lazy().limit(0).collect()
+        return pl.concat(invalid_frames)
+
+    def is_numeric(self, data, column):
+        return data.lazy().collect_schema()[column].is_numeric()
+
+    def dtype(self, data, column):
+        return str(data.lazy().collect_schema()[column])
+
+    def is_low_cardinality(self, data, column, max_ratio):
+        pl = self.pl
+        data = data.lazy()
+        total = data.select(pl.len()).collect().item()
+        cutoff = max_ratio * total
+
+        # Same prefix shortcut as the pandas backend; nulls are dropped so that all backends count alike
+        prefix_length = int(2 * cutoff) + 1
+        if prefix_length < total:
+            prefix = pl.col(column).head(prefix_length).drop_nulls()
+            if data.select(prefix.n_unique()).collect().item() >= cutoff:
+                return False
+        return data.select(pl.col(column).drop_nulls().n_unique()).collect().item() < cutoff
+
+    def zscore_outliers(self, data, column, threshold, group_by=None):
+        pl = self.pl
+        values = pl.col(column)
+        mean, std_dev = values.mean(), values.std()
+        if group_by:
+            mean, std_dev = mean.over(group_by), std_dev.over(group_by)
+        return self._filter(data, ((values - mean) / std_dev).abs() > threshold)
+
+    def frequency_outliers(self, data, column, threshold_percentage, group_by=None):
+        pl = self.pl
+        values = pl.col(column)
+        frequency = pl.len().over((group_by or []) + [column])
+        total_counts = values.count().over(group_by) if group_by else values.count()
+        low_threshold_value = total_counts * (threshold_percentage / 100.0)
+        return self._filter(data, values.is_not_null() & (frequency < low_threshold_value))
+
+    def query(self, data, custom_logic):
+        return self._filter(data, self.pl.sql_expr(custom_logic))
+
+    def select(self, data, invalid_rows):
+        pl = self.pl
+
+        # Convert expressions and boolean masks to the selected rows for consistency
+        if isinstance(invalid_rows, pl.Expr):
+            return self._filter(data, invalid_rows)
+        if isinstance(invalid_rows, pl.Series):
+            return data.lazy().collect().filter(invalid_rows)
+        if isinstance(invalid_rows, pl.LazyFrame):
+            return invalid_rows.collect()
+        if not isinstance(invalid_rows, pl.DataFrame):
+            raise TypeError("The custom function must return a Polars expression, Series or DataFrame.")
+        return invalid_rows
+
+
+# Registered backends, looked up by name
+BACKENDS = {
+    "pandas": PandasBackend,
+    "arrow": ArrowBackend,
+    "polars": PolarsBackend,
+}
+
+# Backend instances, created on first use so optional dependencies are only imported when needed
+_instances = {}
+
+
+def register_backend(name, backend_class):
+    """
+    Registers a custom execution backend for LocalValidator.
+
+    Args:
+        name (str): The name used to select the backend.
+        backend_class (type): A subclass of Backend.
+
+    Raises:
+        TypeError: If input arguments are not of the expected type.
+    """
+    if not isinstance(name, str):
+        raise TypeError("The 'name' argument must be a string.")
+    if not (isinstance(backend_class, type) and issubclass(backend_class, Backend)):
+        raise TypeError("The 'backend_class' argument must be a subclass of Backend.")
+
+    BACKENDS[name] = backend_class
+    _instances.pop(name, None)
+
+
+def get_backend(name):
+    """
+    Returns the backend registered under a name.
+
+    Args:
+        name (str): The name of the backend.
+
+    Returns:
+        Backend: The backend instance.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Available backends are: {', '.join(BACKENDS)}.")
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
+
+
+def detect_backend(data):
+    """
+    Selects the backend matching the type of the data, without importing optional dependencies.
+
+    Args:
+        data: The data to validate.
+
+    Returns:
+        Backend: The backend instance.
+
+    Raises:
+        TypeError: If no backend accepts the data.
+    """
+    if isinstance(data, pd.DataFrame):
+        return get_backend("pandas")
+
+    module = type(data).__module__.split(".")[0]
+    if module == "pyarrow":
+        return get_backend("arrow")
+    if module == "polars":
+        return get_backend("polars")
+
+    # Fall back to custom backends
+    for name in BACKENDS:
+        if name not in ("pandas", "arrow", "polars") and get_backend(name).accepts(data):
+            return get_backend(name)
+
+    raise TypeError(f"No backend is available for data of type '{type(data).__name__}'.")
@@ -0,0 +1,95 @@
+import operator
+
+import numpy as np
+import pandas as pd
+
+
+# Highest number of checks whose bits fit in an int64 column; more checks use Python integers
+INT64_BITS = 63
+
+
+def encode_violations(df, identifier, names=None):
+    """
+    Converts a log with one row per failed check into one row per identifier with a bitmask of failed checks.
+
+    Args:
+        df (pd.DataFrame): Log with the identifier column and a 'Validation Name' column.
+        identifier (str): Column identifying the rows.
+        names (list, optional): Validation names already assigned to bits, in bit order. New names get the next bits.
+
+    Returns:
+        tuple: The bitmap (identifier and 'Failed Checks' columns) and the side table mapping each 'Bit' position
+        to its 'Validation Name'.
+    """
+    names = list(names or [])
+    for name in df["Validation Name"].unique():
+        if name not in names:
+            names.append(name)
+    checks = pd.DataFrame({"Bit": range(len(names)), "Validation Name": names})
+
+    # Each (identifier, check) pair contributes its bit once, so summing the bits is the same as OR-ing them
+    pairs = df[[identifier, "Validation Name"]].drop_duplicates()
+    positions = pairs["Validation Name"].map({name: bit for bit, name in enumerate(names)})
+    if len(names) <= INT64_BITS:
+        bits = pd.Series(np.left_shift(np.int64(1), positions.to_numpy(dtype=np.int64)), index=pairs.index)
+    else:
+        bits = positions.map(lambda bit: 1 << int(bit)).astype(object)
+    masks = bits.groupby(pairs[identifier].to_numpy()).sum()
+
+    bitmap = pd.DataFrame({identifier: masks.index, "Failed Checks": masks.to_numpy()})
+    return bitmap, checks
+
+
+def decode_violations(bitmap, checks, identifier):
+    """
+    Converts a bitmap back to a log with one row per identifier and failed check.
+
+    Args:
+        bitmap (pd.DataFrame): Bitmap with the identifier column and a 'Failed Checks' column.
+        checks (pd.DataFrame): Side table with 'Bit' and 'Validation Name' columns.
+        identifier (str): Column identifying the rows.
+
+    Returns:
+        pd.DataFrame: Log with the identifier column and a 'Validation Name' column.
+    """
+    masks = bitmap["Failed Checks"]
+    frames = []
+    for bit, name in zip(checks["Bit"], checks["Validation Name"]):
+        if masks.dtype == object:
+            failed = masks.map(lambda mask: bool((int(mask) >> int(bit)) & 1))
+        else:
+            failed = (masks.to_numpy(dtype=np.int64) >> int(bit)) & 1 == 1
+        frames.append(pd.DataFrame({identifier: bitmap.loc[failed, identifier].to_numpy(), "Validation Name": name}))
+
+    if not frames:
+        return pd.DataFrame(columns=[identifier, "Validation Name"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def merge_bitmaps(left, right, identifier):
+    """
+    Combines two bitmaps, OR-ing the masks of identifiers present in both.
+
+    Args:
+        left (pd.DataFrame): Bitmap with the identifier column and a 'Failed Checks' column.
+        right (pd.DataFrame): Bitmap with the identifier column and a 'Failed Checks' column.
+        identifier (str): Column identifying the rows.
+
+    Returns:
+        pd.DataFrame: The combined bitmap.
+    """
+    if left.empty:
+        return right.reset_index(drop=True)
+
+    left_masks = left.set_index(identifier)["Failed Checks"]
+    right_masks = right.set_index(identifier)["Failed Checks"]
+    index = left_masks.index.union(right_masks.index, sort=False)
+    left_masks = left_masks.reindex(index, fill_value=0)
+    right_masks = right_masks.reindex(index, fill_value=0)
+
+    if left_masks.dtype == object or right_masks.dtype == object:
+        masks = left_masks.astype(object).combine(right_masks.astype(object), lambda a, b: operator.or_(int(a), int(b)))
+    else:
+        masks = left_masks.astype(np.int64) | right_masks.astype(np.int64)
+
+    return pd.DataFrame({identifier: index, "Failed Checks": masks.to_numpy()})
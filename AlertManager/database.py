@@ -0,0 +1,724 @@
+from sqlalchemy import create_engine, MetaData, Table, Column, select, func, or_, not_, and_, text, literal, cast
+from sqlalchemy.types import Integer, Float, Numeric
+from datetime import datetime
+import functools
+import inspect
+import os
+import threading
+
+import pandas as pd
+
+from AlertManager.bitmap import encode_violations, merge_bitmaps
+from AlertManager.writer import LogWriter
+
+
+# Approximate distinct count functions by SQLAlchemy dialect name
+APPROX_COUNT_DISTINCT = {
+    "mssql": "approx_count_distinct",
+    "oracle": "approx_count_distinct",
+    "snowflake": "approx_count_distinct",
+    "bigquery": "approx_count_distinct",
+    "databricks": "approx_count_distinct",
+    "duckdb": "approx_count_distinct",
+    "trino": "approx_distinct",
+    "presto": "approx_distinct",
+}
+
+
+class DatabaseValidator:
+
+    def __init__(self, connection_string, table_name, schema=None, store=False, history=False,
+                 united=True, identifier=None, path="./validation_logs", file_type="pkl",
+                 background=False, queue_size=1000, backpressure="block", executor=None,
+                 async_connection_string=None, log_store=None, layout="long"):
+        """
+        Args:
+            connection_string (str): The database connection string.
+            table_name (str): The table name to be validated.
+            schema (str, optional): The schema of the table in the database.
+            store (bool): Whether to store validation results.
+            history (bool): Whether to store logs with historical data.
+            united (bool): Whether to store all validations in one file or separately.
+            identifier (str, optional): Column name to identify rows (e.g., primary key).
+            path (str): Directory path where logs will be stored.
+            file_type (str): The file format for storing validation results. Options are 'csv', 'xlsx', 'pkl', 'txt'.
+            background (bool): Whether to write validation results on a background thread instead of inside the call.
+                The thread keeps the validator alive until close() is called or the interpreter exits, so call
+                close() when a validator is no longer needed.
+            queue_size (int): Maximum number of results waiting to be written when background is True.
+            backpressure (str): What to do when the queue is full. Options are 'block', 'drop', 'spill'.
+            executor (concurrent.futures.Executor, optional): Executor for blocking work of async functions.
+                If None, the event loop's default executor is used.
+            async_connection_string (str, optional): Connection string with an async driver
+                (e.g., 'postgresql+asyncpg://...'). Used to run the queries of async functions without blocking the loop.
+            log_store (str or LogStore, optional): Indexed store that receives every saved result in addition to the
+                log files. A string is used as the path of the SQLite file.
+            layout (str): Layout of the united log. Options are 'long' (one row per failed check) and 'bitmap'
+                (one row per identifier with a bitmask of failed checks, plus a 'log_checks' table of bit positions).
+
+        Raises:
+            TypeError: If any of the input arguments are not of the expected type.
+            ValueError: If table_name is not provided.
+        """
+
+        # Initialize attributes based on user input
+        self.store = store  # Determines whether to store validation results
+        self.united = united  # Determines whether to store all validations in one file
+        self.history = history  # Determines whether to store logs with historical data
+        self.file_type = file_type.lower()  # File type for storing validation results
+        self.identifier = identifier  # Column name to identify rows
+        self.layout = layout  # Layout of the united log
+        self.table_name = table_name  # Table name to validate
+        self.schema = schema  # Schema name
+        self.executor = executor  # Executor for blocking work of async functions
+
+        # Validate the types of the input arguments
+        if not isinstance(store, bool):
+            raise TypeError("The 'store' argument must be a boolean.")
+        if not isinstance(united, bool):
+            raise TypeError("The 'united' argument must be a boolean.")
+        if not isinstance(history, bool):
+            raise TypeError("The 'history' argument must be a boolean.")
+        if not isinstance(file_type, str):
+            raise TypeError("The 'file_type' argument must be a string.")
+        if not isinstance(background, bool):
+            raise TypeError("The 'background' argument must be a boolean.")
+        if layout not in ['long', 'bitmap']:
+            raise ValueError("The 'layout' argument must be 'long' or 'bitmap'.")
+        if layout == 'bitmap' and not (united and identifier):
+            raise ValueError("The 'bitmap' layout requires united=True and an identifier.")
+        if not isinstance(connection_string, str):
+            raise TypeError("The 'connection_string' argument must be a string.")
+        if not isinstance(table_name, str):
+            raise TypeError("The 'table_name' argument must be a string.")
+        if schema is not None and not isinstance(schema, str):
+            raise TypeError("The 'schema' argument must be a string or None.")
+        if async_connection_string is not None and not isinstance(async_connection_string, str):
+            raise TypeError("The 'async_connection_string' argument must be a string or None.")
+
+        # Set the path for storing logs, including daily subdirectories if history is True
+        if history:
+            self._path = os.path.join(path, f"{datetime.now().strftime('%Y-%m-%d')}")
+        else:
+            self._path = path
+
+        # Create the directory if it doesn't exist
+        if not os.path.exists(self._path):
+            os.makedirs(self._path)
+
+        # Initialize an empty DataFrame for storing all validation results if united is True
+        self._all_validations_df = pd.DataFrame()
+
+        # Serializes saves from concurrent calls, see _save_batch
+        self._save_lock = threading.Lock()
+
+        # Inferred data types by column, used by statistical checks
+        self._inferred_types = {}
+
+        # Query builders of the registered checks by validation name, used by validate()
+        self._checks = {}
+
+        # Open the indexed log store, if requested; sqlite3 is only imported when a store is used
+        if log_store is not None:
+            from AlertManager.store import LogStore
+            if isinstance(log_store, str):
+                log_store = LogStore(log_store)
+            if not isinstance(log_store, LogStore):
+                raise TypeError("The 'log_store' argument must be a string, a LogStore or None.")
+        self.log_store = log_store  # Indexed store of validation results
+
+        # Validation names in bit order, used by the 'bitmap' layout
+        self._check_names = []
+
+        # Start the background writer if results should not be written inside the call
+        self._writer = None
+        if background:
+            self._writer = LogWriter(self._save_batch, queue_size=queue_size, backpressure=backpressure,
+                                     spill_path=os.path.join(self._path, ".spill"))
+
+        # Create database engine and metadata
+        self.engine = create_engine(connection_string)
+        # Use MetaData without the bind parameter
+        self.metadata = MetaData()
+
+        # Reflect the table from the database
+        self.metadata.reflect(bind=self.engine, schema=schema)
+        self.table = self.metadata.tables[f"{schema}.{table_name}" if schema else table_name]
+
+        # Create the async engine used by async functions, if an async driver was provided
+        self.async_engine = None
+        if async_connection_string is not None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+            self.async_engine = create_async_engine(async_connection_string)
+
+    def range_check(self, *, column: str, borders: list, name: str, **kwargs):
+        """
+        Decorator to validate that the values in a specified column fall within given ranges.
+
+        Args:
+            column (str): The column in the table to be validated.
+            borders (list): A list of tuples, each containing two numeric values representing the lower and upper bounds.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: A wrapped function with the validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if not isinstance(borders, list) or not all(isinstance(i, tuple) and len(i) == 2 for i in borders):
+            raise TypeError("The 'borders' argument must be a list of tuples with two numeric values.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        def build_query():
+            # Ensure the column exists in the table schema
+            if column not in self.table.c:
+                raise ValueError(f"Error: Column '{column}' not found in table '{self.table_name}'.")
+
+            # Build the in-range condition
+            in_range_conditions = []
+            for bottom, top in borders:
+                in_range_conditions.append(self.table.c[column].between(bottom, top))
+
+            # Combine conditions for values within any of the ranges
+            in_range_condition = or_(*in_range_conditions)
+
+            # Condition for values outside the ranges
+            out_of_range_condition = not_(in_range_condition)
+
+            # Select columns for output
+            select_columns = [self.table.c[self.identifier]] if self.identifier else [self.table.c[column]]
+
+            # Construct the query
+            query = select(select_columns).where(out_of_range_condition)
+
+            return query
+
+        # Register the check so it can also run through validate()
+        self._checks[name] = build_query
+
+        def decorator(func):
+            return self._wrap(func, build_query, name)
+        return decorator
+
+    def value_check(self, *, column: str, allowed: list = None, not_allowed: list = None, name: str, **kwargs):
+        """
+        Decorator to validate that the values in a specified column are either allowed or not allowed.
+
+        Args:
+            column (str): The column in the table to be validated.
+            allowed (list, optional): A list of allowed values for the column.
+            not_allowed (list, optional): A list of not allowed values for the column.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: A wrapped function with the validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if allowed is not None and not isinstance(allowed, list):
+            raise TypeError("The 'allowed' argument must be a list.")
+        if not_allowed is not None and not isinstance(not_allowed, list):
+            raise TypeError("The 'not_allowed' argument must be a list.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        def build_query():
+            if column not in self.table.c:
+                raise ValueError(f"Error: Column '{column}' not found in table '{self.table_name}'.")
+
+            conditions = []
+            if allowed is not None:
+                conditions.append(not_(self.table.c[column].in_(allowed)))
+            if not_allowed is not None:
+                conditions.append(self.table.c[column].in_(not_allowed))
+
+            # Combine conditions
+            invalid_condition = or_(*conditions)
+
+            # Select columns for output
+            select_columns = [self.table.c[self.identifier]] if self.identifier else [self.table.c[column]]
+
+            # Construct the query
+            query = select(select_columns).where(invalid_condition)
+
+            return query
+
+        # Register the check so it can also run through validate()
+        self._checks[name] = build_query
+
+        def decorator(func):
+            return self._wrap(func, build_query, name)
+        return decorator
+
+    def statistical(self, *, column: str, name: str, sensitivity="medium", data_type=None, group_by=None, **kwargs):
+        """
+        Decorator to apply statistical outlier detection on a database table column.
+        Uses z-score for continuous data and frequency-based detection for discrete data.
+
+        Args:
+            column (str): The column in the table to be validated.
+            name (str): The name of the validation for logging purposes.
+            sensitivity (str): The sensitivity level of the validation. Options are 'sensitive', 'medium', 'insensitive'.
+            data_type (str, optional): Specify 'continuous' or 'discrete'. If None, the type will be inferred.
+            group_by (str or list, optional): Column(s) defining segments. If given, thresholds are computed per segment.
+
+        Returns:
+            function: A wrapped function with the statistical validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+            ValueError: If an invalid value is provided for 'sensitivity' or 'data_type'.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+        if not isinstance(sensitivity, str):
+            raise TypeError("The 'sensitivity' argument must be a string.")
+        if sensitivity.lower() not in ['sensitive', 'medium', 'insensitive']:
+            raise ValueError("The 'sensitivity' argument must be one of 'sensitive', 'medium', or 'insensitive'.")
+        if data_type is not None and data_type.lower() not in ['continuous', 'discrete']:
+            raise ValueError("The 'data_type' argument must be 'continuous', 'discrete', or None.")
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        if group_by is not None and not (isinstance(group_by, list) and all(isinstance(i, str) for i in group_by)):
+            raise TypeError("The 'group_by' argument must be a string or a list of strings.")
+
+        def build_query():
+            for required_column in [column] + (group_by or []):
+                if required_column not in self.table.c:
+                    raise ValueError(f"Error: Column '{required_column}' not found in table '{self.table_name}'.")
+
+            # Output column and, for segmented checks, the window partition
+            output_column = self.table.c[self.identifier] if self.identifier else self.table.c[column]
+            partition = [self.table.c[group_column] for group_column in group_by or []]
+
+            # Infer data type if not provided
+            if data_type is None:
+                inferred_type = self._infer_type(column)
+            else:
+                inferred_type = data_type.lower()
+
+            if inferred_type == 'continuous':
+                # Set z-score threshold based on sensitivity
+                z_score_thresholds = {'sensitive': 2.0, 'medium': 3.0, 'insensitive': 4.0}
+                z_threshold = z_score_thresholds[sensitivity.lower()]
+
+                if partition:
+                    # Window functions attach the mean and stddev of each segment to its rows in one pass; the
+                    # private labels cannot collide with the output column
+                    stats_subquery = select(
+                        output_column.label('__output'),
+                        self.table.c[column].label('__value'),
+                        func.avg(self.table.c[column]).over(partition_by=partition).label('__mean'),
+                        func.stddev(self.table.c[column]).over(partition_by=partition).label('__std')
+                    ).subquery()
+                    stats = stats_subquery.c
+
+                    # Constant segments have no spread; NULLIF skips them instead of dividing by zero
+                    z_score = (stats['__value'] - stats['__mean']) / func.nullif(stats['__std'], 0)
+                    return select(stats['__output'].label(output_column.name)).where(func.abs(z_score) > z_threshold)
+
+                # Subquery to calculate mean and stddev
+                stats_subquery = select(
+                    func.avg(self.table.c[column]).label('mean'),
+                    func.stddev(self.table.c[column]).label('std')
+                ).subquery()
+
+                # Main query to find outliers
+                mean = stats_subquery.c.mean
+                std = stats_subquery.c.std
+                z_score = (self.table.c[column] - mean) / func.nullif(std, 0)
+
+                outlier_condition = func.abs(z_score) > z_threshold
+
+                # Select columns for output
+                select_columns = [self.table.c[self.identifier]] if self.identifier else [self.table.c[column]]
+
+                # Construct the query
+                query = select(select_columns).select_from(
+                    self.table.join(stats_subquery, literal(True))
+                ).where(outlier_condition)
+
+            elif inferred_type == 'discrete':
+                # Set frequency threshold based on sensitivity
+                frequency_thresholds = {'sensitive': 0.02, 'medium': 0.01, 'insensitive': 0.005}
+                freq_threshold = frequency_thresholds[sensitivity.lower()]
+
+                if partition:
+                    # Window functions count each value and all non-null values within the segment of every row
+                    frequency_subquery = select(
+                        output_column.label('__output'),
+                        self.table.c[column].label('__value'),
+                        func.count().over(partition_by=partition + [self.table.c[column]]).label('__freq'),
+                        func.count(self.table.c[column]).over(partition_by=partition).label('__total')
+                    ).subquery()
+                    frequency = frequency_subquery.c
+
+                    low_freq_condition = and_(
+                        frequency['__value'].isnot(None),
+                        # Segments whose values are all NULL have no total; NULLIF skips them
+                        cast(frequency['__freq'], Float) / func.nullif(frequency['__total'], 0) < freq_threshold
+                    )
+                    return select(frequency['__output'].label(output_column.name)).where(low_freq_condition)
+
+                # Frequency-based outlier detection
+                frequency_subquery = select(
+                    self.table.c[column],
+                    func.count(self.table.c[column]).label('__freq')
+                ).group_by(self.table.c[column]).subquery()
+
+                total_count_subquery = select(func.count()).select_from(self.table).scalar_subquery()
+
+                # Condition for low-frequency values, cast to avoid integer division
+                low_freq_condition = (cast(frequency_subquery.c['__freq'], Float) / total_count_subquery) < freq_threshold
+
+                # Subquery to get low-frequency values
+                low_freq_values_subquery = select(frequency_subquery.c[column]).where(low_freq_condition).subquery()
+
+                # Main query to get rows with low-frequency values
+                query = select(
+                    self.table.c[self.identifier] if self.identifier else self.table.c[column]
+                ).where(self.table.c[column].in_(select(low_freq_values_subquery)))
+
+            else:
+                raise ValueError("Invalid data type specified.")
+
+            return query
+
+        # Register the check so it can also run through validate()
+        self._checks[name] = build_query
+
+        def decorator(func):
+            return self._wrap(func, build_query, name)
+        return decorator
+
+    def custom_check(self, *, custom_logic, name: str, **kwargs):
+        """
+        Decorator to apply custom validation logic on a database table.
+
+        Args:
+            custom_logic (str or callable): The custom logic for validation, can be a query string or a function.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: A wrapped function with the custom validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+            ValueError: If the custom logic string or function fails to execute.
+        """
+
+        # Validate input types
+        if not (isinstance(custom_logic, str) or callable(custom_logic)):
+            raise TypeError("The 'custom_logic' argument must be a string or a callable (function).")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        def build_query():
+            # Apply custom logic if it's a string (SQL condition)
+            if isinstance(custom_logic, str):
+                try:
+                    # Construct the query using the custom logic as a WHERE clause
+                    condition = text(custom_logic)
+                    select_columns = [self.table.c[self.identifier]] if self.identifier else list(self.table.c)
+                    query = select(select_columns).where(condition)
+                except Exception as e:
+                    raise ValueError(f"Error in custom logic: {str(e)}")
+
+            # Apply custom logic if it's a callable (function)
+            elif callable(custom_logic):
+                try:
+                    # The custom function should return a SQLAlchemy condition
+                    condition = custom_logic(self.table)
+                    select_columns = [self.table.c[self.identifier]] if self.identifier else list(self.table.c)
+                    query = select(select_columns).where(condition)
+                except Exception as e:
+                    raise ValueError(f"Error in custom function: {str(e)}")
+            else:
+                raise TypeError("The 'custom_logic' argument must be a string or a callable (function).")
+
+            return query
+
+        # Register the check so it can also run through validate()
+        self._checks[name] = build_query
+
+        def decorator(func):
+            return self._wrap(func, build_query, name)
+
+        return decorator
+
+    def validate(self, names=None):
+        """
+        Runs registered checks without calling a decorated function.
+
+        Args:
+            names (list, optional): The validation names to run. If None, all registered checks run.
+
+        Returns:
+            dict: The invalid rows of each check as pandas DataFrames, keyed by validation name.
+
+        Raises:
+            ValueError: If a name is not a registered check.
+        """
+        names = list(self._checks) if names is None else names
+        for name in names:
+            if name not in self._checks:
+                raise ValueError(f"Error: No check named '{name}' is registered.")
+
+        results = {}
+        for name in names:
+            results[name] = self._execute(self._checks[name]())
+
+            # Save the invalid rows if any exist and storing is enabled
+            if not results[name].empty and self.store:
+                self._log(results[name], name)
+
+        return results
+
+    def _infer_type(self, column):
+        """
+        Infers whether a column is 'continuous' or 'discrete'. Non-numeric columns are discrete; numeric columns
+        are discrete if their approximate distinct count is less than 5% of the rows. The result is cached, so the
+        count query runs once per column.
+
+        Args:
+            column (str): The column to inspect.
+
+        Returns:
+            str: 'continuous' or 'discrete'.
+        """
+        if column not in self._inferred_types:
+            if not isinstance(self.table.c[column].type, (Integer, Float, Numeric)):
+                self._inferred_types[column] = 'discrete'
+            else:
+                # Use the dialect's approximate distinct count if it has one, the exact count otherwise
+                approx_function = APPROX_COUNT_DISTINCT.get(self.engine.dialect.name)
+                if approx_function is not None:
+                    distinct_count = getattr(func, approx_function)(self.table.c[column])
+                else:
+                    distinct_count = func.count(self.table.c[column].distinct())
+                query = select(distinct_count.label('unique'), func.count().label('total')).select_from(self.table)
+
+                with self.engine.connect() as conn:
+                    unique, total = conn.execute(query).one()
+
+                # Heuristic: If the number of unique values is less than 5% of total, treat as discrete
+                if total and unique / total < 0.05:
+                    self._inferred_types[column] = 'discrete'
+                else:
+                    self._inferred_types[column] = 'continuous'
+        return self._inferred_types[column]
+
+    def _wrap(self, func, build_query, name):
+        """
+        Wraps a function so that the validation query runs before it is called.
+        Coroutine functions get an async wrapper that runs the query without blocking the event loop.
+
+        Args:
+            func (callable): The function being decorated.
+            build_query (callable): Function returning the query that selects the invalid rows.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: The wrapped function.
+        """
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs_func):
+                # asyncio is imported here, where a loop is already running, to keep it out of the package import
+                import asyncio
+
+                # Build the query off the event loop, since inferring the data type of a statistical check runs a
+                # blocking query on the synchronous engine the first time
+                loop = asyncio.get_running_loop()
+                query = await loop.run_in_executor(self.executor, build_query)
+                invalid_rows = await self._execute_async(query)
+
+                # Save the invalid rows if any exist and storing is enabled
+                if not invalid_rows.empty and self.store:
+                    await loop.run_in_executor(self.executor, self._log, invalid_rows, name)
+
+                # Await the wrapped coroutine with the original arguments
+                return await func(*args, **kwargs_func)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs_func):
+            invalid_rows = self._execute(build_query())
+
+            # Save the invalid rows if any exist and storing is enabled
+            if not invalid_rows.empty and self.store:
+                self._log(invalid_rows, name)
+
+            # Execute the wrapped function with the original arguments
+            return func(*args, **kwargs_func)
+
+        return wrapper
+
+    def _execute(self, query):
+        """
+        Executes a query and returns the result as a DataFrame.
+
+        Args:
+            query (sqlalchemy.sql.Select): The query to execute.
+
+        Returns:
+            pd.DataFrame: The selected rows.
+        """
+        with self.engine.connect() as conn:
+            result = conn.execute(query).fetchall()
+        return pd.DataFrame(result, columns=[col.name for col in query.selected_columns])
+
+    async def _execute_async(self, query):
+        """
+        Executes a query through the async engine, or in an executor if no async engine is configured.
+
+        Args:
+            query (sqlalchemy.sql.Select): The query to execute.
+
+        Returns:
+            pd.DataFrame: The selected rows.
+        """
+        if self.async_engine is None:
+            import asyncio
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._execute, query)
+
+        async with self.async_engine.connect() as conn:
+            result = await conn.execute(query)
+            rows = result.fetchall()
+        return pd.DataFrame(rows, columns=[col.name for col in query.selected_columns])
+
+    def flush(self):
+        """
+        Blocks until all validation results queued for the background writer have been written.
+
+        Raises:
+            Exception: The first error raised while writing in the background since the last flush.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """
+        Flushes pending validation results and stops the background writer.
+        """
+        if self._writer is not None:
+            self._writer.close()
+
+    def _log(self, outliers, name):
+        """
+        Hands the outliers to the background writer if enabled, otherwise saves them immediately.
+
+        Args:
+            outliers (pd.DataFrame): DataFrame containing the outliers.
+            name (str): The name of the validation for logging purposes.
+        """
+        if self._writer is not None:
+            self._writer.submit((outliers, name))
+        else:
+            self._save(outliers, name)
+
+    def _save(self, outliers, name):
+        """
+        Saves the outliers to a file based on the validator settings.
+
+        Args:
+            outliers (pd.DataFrame): DataFrame containing the outliers.
+            name (str): The name of the validation for logging purposes.
+        """
+        self._save_batch([(outliers, name)])
+
+    def _save_batch(self, batch):
+        """
+        Saves several sets of outliers at once, writing each target file only one time.
+
+        Args:
+            batch (list): A list of (outliers, name) tuples.
+        """
+        # Async calls and scheduler threads can save at the same time; the united log is read, extended and
+        # rewritten here, so concurrent saves are serialized to not lose each other's rows
+        with self._save_lock:
+            tagged = []
+            for outliers, name in batch:
+                # Create a copy of the outliers DataFrame to avoid modifying the original
+                outliers = outliers.copy()
+
+                # Add a new column to track the name of the validation that generated the outliers
+                outliers["Validation Name"] = name
+                if self.identifier:
+                    outliers = outliers[[self.identifier, "Validation Name"]]
+                tagged.append((outliers, name))
+
+            # Add the outliers to the indexed log store, if one is configured. Rows are tagged with the log file they
+            # are written to, so ingesting the log directory later replaces them instead of adding them twice
+            if self.log_store is not None:
+                for outliers, name in tagged:
+                    log_name = "log" if self.united else name
+                    source = os.path.abspath(os.path.join(self._path, f"{log_name}.{self.file_type}"))
+                    self.log_store.append(outliers, name=name, identifier=self.identifier, source=source)
+
+            # In the bitmap layout, OR the failed checks of each identifier into the existing bitmap
+            if self.layout == "bitmap":
+                new_outliers = pd.concat([outliers for outliers, name in tagged], ignore_index=True)
+                bitmap, checks = encode_violations(new_outliers, self.identifier, self._check_names)
+                self._check_names = checks["Validation Name"].tolist()
+                self._all_validations_df = merge_bitmaps(self._all_validations_df, bitmap, self.identifier)
+                # Save the bitmap to 'log' and the bit positions to 'log_checks' in the specified path
+                self._save_file(self._all_validations_df, os.path.join(self._path, "log"))
+                self._save_file(checks, os.path.join(self._path, "log_checks"))
+
+            # If united is True, concatenate the outliers with the existing DataFrame of all validations
+            elif self.united:
+                all_outliers = [outliers for outliers, name in tagged]
+                self._all_validations_df = pd.concat([self._all_validations_df] + all_outliers, ignore_index=True)
+                # Save the combined DataFrame to a file named 'log' in the specified path
+                self._save_file(self._all_validations_df, os.path.join(self._path, "log"))
+            else:
+                # Save the outliers DataFrame to a file named after the validation name, keeping the latest result
+                latest = {name: outliers for outliers, name in tagged}
+                for name, outliers in latest.items():
+                    self._save_file(outliers, os.path.join(self._path, f"{name}"))
+
+    def _save_file(self, df, file_name):
+        """
+        Saves a DataFrame to a file in the specified format.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to save.
+            file_name (str): The path and base name of the file.
+
+        Raises:
+            ValueError: If the specified file type is not supported.
+        """
+        # Check the file type and save the DataFrame accordingly
+        if self.file_type == "csv":
+            df.to_csv(f"{file_name}.csv", index=False, encoding='utf-8')
+        elif self.file_type == "xlsx":
+            df.to_excel(f"{file_name}.xlsx", index=False)
+        elif self.file_type == "pkl":
+            df.to_pickle(f"{file_name}.pkl")
+        elif self.file_type == "txt":
+            with open(f"{file_name}.txt", "w") as log:
+                df.to_string(log)
+                log.write("\n")
+        else:
+            # Raise an error if the file type is not supported
+            raise ValueError("Unsupported file type. Supported types are: 'csv', 'xlsx', 'pkl', 'txt'")
+
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+
+from AlertManager.backends import _require
+
+
+def detect_format(source, file_format=None):
+    """
+    Determines the format of a file or dataset directory.
+
+    Args:
+        source (str): Path to a file or a dataset directory.
+        file_format (str, optional): Explicit format. Options are 'parquet', 'csv'.
+
+    Returns:
+        str: The format of the source.
+
+    Raises:
+        ValueError: If the format is not supported or cannot be determined.
+    """
+    if file_format is None:
+        if os.path.isdir(source):
+            file_format = "parquet"
+        else:
+            extension = os.path.splitext(source)[1].lower()
+            file_format = {".parquet": "parquet", ".pq": "parquet", ".csv": "csv"}.get(extension)
+
+    if file_format not in ("parquet", "csv"):
+        raise ValueError("Unsupported file format. Supported formats are: 'parquet', 'csv'")
+    return file_format
+
+
+def _dataset(source, file_format):
+    """
+    Opens a file or directory as a pyarrow dataset.
+    """
+    ds = _require("pyarrow.dataset", "arrow")
+    return ds.dataset(source, format=file_format)
+
+
+def read_columns(source, columns=None, file_format=None, **read_options):
+    """
+    Reads only the given columns of a file or dataset directory.
+
+    Args:
+        source (str): Path to a file or a dataset directory.
+        columns (list, optional): The columns to read. If None, all columns are read.
+        file_format (str, optional): Explicit format. Options are 'parquet', 'csv'.
+        **read_options: Extra options passed to pandas.read_csv for single CSV files.
+
+    Returns:
+        pd.DataFrame or pyarrow.Table: The projected data. Parquet sources and directories are returned as
+        Arrow tables, single CSV files as pandas DataFrames.
+    """
+    file_format = detect_format(source, file_format)
+
+    if file_format == "csv" and not os.path.isdir(source):
+        return pd.read_csv(source, usecols=columns, **read_options)
+
+    return _dataset(source, file_format).to_table(columns=columns)
+
+
+def read_out_of_range(source, column, borders, columns=None, file_format=None):
+    """
+    Reads the rows of a Parquet file or dataset whose values fall outside all of the given ranges.
+    Row groups whose min/max statistics lie inside one of the ranges are skipped without being read.
+
+    Args:
+        source (str): Path to a file or a dataset directory.
+        column (str): The column the ranges apply to.
+        borders (list): A list of tuples, each containing the lower and upper bound of a range.
+        columns (list, optional): The columns to read. If None, all columns are read.
+        file_format (str, optional): Explicit format. Options are 'parquet', 'csv'.
+
+    Returns:
+        pyarrow.Table: The rows that may be out of range.
+    """
+    ds = _require("pyarrow.dataset", "arrow")
+    field = ds.field(column)
+
+    # Rows are out of range when they are not within any range; null values are never within a range
+    in_range = None
+    for bottom, top in borders:
+        condition = (field >= bottom) & (field <= top)
+        in_range = condition if in_range is None else in_range | condition
+    out_of_range = ~in_range | field.is_null() if in_range is not None else None
+
+    return _dataset(source, detect_format(source, file_format)).to_table(columns=columns, filter=out_of_range)
@@ -0,0 +1,654 @@
+from datetime import datetime
+import functools
+import inspect
+import os
+import threading
+
+import pandas as pd
+
+from AlertManager.backends import detect_backend, get_backend
+from AlertManager.bitmap import encode_violations, merge_bitmaps
+from AlertManager.files import detect_format, read_columns, read_out_of_range
+from AlertManager.writer import LogWriter
+
+
+class LocalValidator:
+
+    def __init__(self, store=False, history=False, united=True, identifier=None, path="./validation logs", file_type="pkl",
+                 background=False, queue_size=1000, backpressure="block", executor=None, backend="auto",
+                 log_store=None, layout="long"):
+        """
+        Args:
+            store (bool): Whether to store validation results.
+            history (bool): Whether to store logs with historical data.
+            united (bool): Whether to store all validations in one file or separately.
+            identifier (str, optional): Column name to identify rows (e.g., primary key).
+            path (str): Directory path where logs will be stored.
+            file_type (str): The file format for storing validation results. Options are 'csv', 'xlsx', 'pkl', 'txt'.
+            background (bool): Whether to write validation results on a background thread instead of inside the call.
+                The thread keeps the validator alive until close() is called or the interpreter exits, so call
+                close() when a validator is no longer needed.
+            queue_size (int): Maximum number of results waiting to be written when background is True.
+            backpressure (str): What to do when the queue is full. Options are 'block', 'drop', 'spill'.
+            executor (concurrent.futures.Executor, optional): Executor running the checks of async functions.
+                If None, the event loop's default executor is used.
+            backend (str): The execution backend for the checks. Options are 'auto', 'pandas', 'arrow', 'polars',
+                or the name of a registered custom backend. 'auto' selects the backend from the type of the data.
+            log_store (str or LogStore, optional): Indexed store that receives every saved result in addition to the
+                log files. A string is used as the path of the SQLite file.
+            layout (str): Layout of the united log. Options are 'long' (one row per failed check) and 'bitmap'
+                (one row per identifier with a bitmask of failed checks, plus a 'log_checks' table of bit positions).
+
+        Raises:
+            TypeError: If any of the input arguments are not of the expected type.
+        """
+
+        # Initialize attributes based on user input
+        self.store = store  # Determines whether to store validation results
+        self.united = united  # Determines whether to store all validations in one file
+        self.history = history  # Determines whether to store logs with historical data
+        self.file_type = file_type.lower()  # File type for storing validation results
+        self.identifier = identifier  # Column name to identify rows
+        self.layout = layout  # Layout of the united log
+        self.executor = executor  # Executor for the checks of async functions
+        self.backend = backend  # Execution backend for the checks
+
+        # Set the path for storing logs, including daily subdirectories if history is True
+        if history:
+            self._path = os.path.join(path, f"{datetime.now().strftime('%Y-%m-%d')}")
+        else:
+            self._path = path
+
+        # Initialize an empty DataFrame for storing all validation results if united is True
+        self._all_validations_df = pd.DataFrame()
+
+        # Serializes saves from concurrent calls, see _save_batch
+        self._save_lock = threading.Lock()
+
+        # Registered checks by validation name, used by validate() and validate_file()
+        self._checks = {}
+
+        # Inferred data types by (validation name, column, column type), used by statistical checks
+        self._inferred_types = {}
+
+        # Validate the types of the input arguments
+        if not isinstance(store, bool):
+            raise TypeError("The 'store' argument must be a boolean.")
+        if not isinstance(united, bool):
+            raise TypeError("The 'united' argument must be a boolean.")
+        if not isinstance(history, bool):
+            raise TypeError("The 'history' argument must be a boolean.")
+        if not isinstance(file_type, str):
+            raise TypeError("The 'file_type' argument must be a string.")
+        if not isinstance(background, bool):
+            raise TypeError("The 'background' argument must be a boolean.")
+        if layout not in ['long', 'bitmap']:
+            raise ValueError("The 'layout' argument must be 'long' or 'bitmap'.")
+        if layout == 'bitmap' and not (united and identifier):
+            raise ValueError("The 'bitmap' layout requires united=True and an identifier.")
+        if not isinstance(backend, str):
+            raise TypeError("The 'backend' argument must be a string.")
+
+        # Create the directory if it doesn't exist
+        if not os.path.exists(self._path):
+            os.makedirs(self._path)
+
+        # Open the indexed log store, if requested; sqlite3 is only imported when a store is used
+        if log_store is not None:
+            from AlertManager.store import LogStore
+            if isinstance(log_store, str):
+                log_store = LogStore(log_store)
+            if not isinstance(log_store, LogStore):
+                raise TypeError("The 'log_store' argument must be a string, a LogStore or None.")
+        self.log_store = log_store  # Indexed store of validation results
+
+        # Validation names in bit order, used by the 'bitmap' layout
+        self._check_names = []
+
+        # Start the background writer if results should not be written inside the call
+        self._writer = None
+        if background:
+            self._writer = LogWriter(self._save_batch, queue_size=queue_size, backpressure=backpressure,
+                                     spill_path=os.path.join(self._path, ".spill"))
+
+    def range_check(self, *, column: str, borders: list, name: str, **kwargs):
+        """
+        Decorator to validate that the values in a specified column fall within given ranges.
+
+        Args:
+            column (str): The column in the DataFrame to be validated.
+            borders (list): A list of tuples, each containing two numeric values representing the lower and upper bounds.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: A wrapped function with the validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if not isinstance(borders, list) or not all(isinstance(i, tuple) and len(i) == 2 for i in borders):
+            raise TypeError("The 'borders' argument must be a list of tuples with two numeric values.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        def find_invalid(df, backend):
+            # Check if the specified column exists in the DataFrame
+            if column not in backend.columns(df):
+                raise ValueError(f"Error: Column '{column}' not found in DataFrame.")
+
+            # Identify rows where values are out of bounds
+            return backend.out_of_range(df, column, borders)
+
+        # Register the check so it can also run through validate() and validate_file()
+        self._register(name, find_invalid, columns=[column], borders=borders)
+
+        def decorator(func):
+            return self._wrap(func, find_invalid, name)
+        return decorator
+
+    def value_check(self, *, column: str, allowed: list = None, not_allowed: list = None, name: str, **kwargs):
+        """
+        Decorator to validate that the values in a specified column are either allowed or not allowed.
+
+        Args:
+            column (str): The column in the DataFrame to be validated.
+            allowed (list, optional): A list of allowed values for the column.
+            not_allowed (list, optional): A list of not allowed values for the column.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: A wrapped function with the validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if allowed is not None and not isinstance(allowed, list):
+            raise TypeError("The 'allowed' argument must be a list.")
+        if not_allowed is not None and not isinstance(not_allowed, list):
+            raise TypeError("The 'not_allowed' argument must be a list.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        def find_invalid(df, backend):
+            # Check if the specified column exists in the DataFrame
+            if column not in backend.columns(df):
+                raise ValueError(f"Error: Column '{column}' not found in DataFrame.")
+
+            # Identify rows with values outside the allowed list or inside the not allowed list
+            return backend.value_violations(df, column, allowed, not_allowed)
+
+        # Register the check so it can also run through validate() and validate_file()
+        self._register(name, find_invalid, columns=[column])
+
+        def decorator(func):
+            return self._wrap(func, find_invalid, name)
+        return decorator
+
+    def statistical(self, *, column: str, name: str, sensitivity="medium", data_type=None, group_by=None, **kwargs):
+        """
+        Decorator to apply statistical outlier detection on a DataFrame column.
+        Uses z-score for continuous data and frequency-based detection for discrete data.
+
+        Args:
+            column (str): The column in the DataFrame to be validated.
+            name (str): The name of the validation for logging purposes.
+            sensitivity (str): The sensitivity level of the validation. Options are 'sensitive', 'medium', 'insensitive'.
+            data_type (str, optional): Specify 'continuous' or 'discrete'. If None, the type will be inferred.
+            group_by (str or list, optional): Column(s) defining segments. If given, thresholds are computed per segment.
+
+        Returns:
+            function: A wrapped function with the statistical validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+            ValueError: If an invalid value is provided for 'sensitivity' or 'data_type'.
+        """
+
+        # Validate input types
+        if not isinstance(column, str):
+            raise TypeError("The 'column' argument must be a string.")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+        if not isinstance(sensitivity, str):
+            raise TypeError("The 'sensitivity' argument must be a string.")
+        if sensitivity.lower() not in ['sensitive', 'medium', 'insensitive']:
+            raise ValueError("The 'sensitivity' argument must be one of 'sensitive', 'medium', or 'insensitive'.")
+        if data_type is not None and data_type.lower() not in ['continuous', 'discrete']:
+            raise ValueError("The 'data_type' argument must be 'continuous', 'discrete', or None.")
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        if group_by is not None and not (isinstance(group_by, list) and all(isinstance(i, str) for i in group_by)):
+            raise TypeError("The 'group_by' argument must be a string or a list of strings.")
+
+        def find_invalid(df, backend):
+            # Check if the specified columns exist in the DataFrame
+            for required_column in [column] + (group_by or []):
+                if required_column not in backend.columns(df):
+                    raise ValueError(f"Error: Column '{required_column}' not found in DataFrame.")
+
+            # Infer data type if not provided
+            if data_type is None:
+                inferred_type = self._infer_type(name, df, column, backend)
+            else:
+                inferred_type = data_type.lower()
+
+            if inferred_type == 'continuous':
+                # Ensure the column is numeric
+                if not backend.is_numeric(df, column):
+                    raise TypeError(f"Column '{column}' must be numeric for continuous outlier detection.")
+
+                # Select thresholds based on 'sensitivity'
+                if sensitivity.lower() == 'sensitive':
+                    z_score_threshold = 2.0
+                elif sensitivity.lower() == 'medium':
+                    z_score_threshold = 3.0
+                elif sensitivity.lower() == 'insensitive':
+                    z_score_threshold = 4.0
+
+                # Data is continuous, identify outliers using z-score method
+                outliers = backend.zscore_outliers(df, column, z_score_threshold, group_by)
+
+            elif inferred_type == 'discrete':
+                # Define low frequency threshold percentage based on sensitivity
+                if sensitivity.lower() == 'sensitive':
+                    low_frequency_threshold_percentage = 2
+                elif sensitivity.lower() == 'medium':
+                    low_frequency_threshold_percentage = 1
+                elif sensitivity.lower() == 'insensitive':
+                    low_frequency_threshold_percentage = 0.5
+
+                # Identify rows containing values that occur less frequently than the threshold
+                outliers = backend.frequency_outliers(df, column, low_frequency_threshold_percentage, group_by)
+
+            else:
+                raise ValueError("Invalid data type specified.")
+
+            return outliers
+
+        # Register the check so it can also run through validate() and validate_file()
+        self._register(name, find_invalid, columns=[column] + (group_by or []))
+
+        def decorator(func):
+            return self._wrap(func, find_invalid, name)
+        return decorator
+
+    def custom_check(self, *, custom_logic, name: str, columns: list = None, **kwargs):
+        """
+        Decorator to apply custom validation logic on a DataFrame.
+
+        Args:
+            custom_logic (str or callable): The custom logic for validation, can be a query string or a function.
+            name (str): The name of the validation for logging purposes.
+            columns (list, optional): The columns used by the custom logic. Lets validate_file() read only these
+                columns; if None, all columns are read.
+
+        Returns:
+            function: A wrapped function with the custom validation applied.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+            ValueError: If the custom logic string or function fails to execute.
+        """
+
+        # Validate input types
+        if not (isinstance(custom_logic, str) or callable(custom_logic)):
+            raise TypeError("The 'custom_logic' argument must be a string or a callable (function).")
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+        if columns is not None and not isinstance(columns, list):
+            raise TypeError("The 'columns' argument must be a list.")
+
+        def find_invalid(df, backend):
+            # Apply custom logic if it's a string (query)
+            if isinstance(custom_logic, str):
+                try:
+                    invalid_rows = backend.query(df, custom_logic)
+                except Exception as e:
+                    raise ValueError(f"Error in custom logic: {str(e)}")
+
+            # Apply custom logic if it's a callable (function)
+            elif callable(custom_logic):
+                try:
+                    invalid_rows = custom_logic(df)
+                except Exception as e:
+                    raise ValueError(f"Error in custom function: {str(e)}")
+
+                # Convert mask results to the selected rows for consistency
+                invalid_rows = backend.select(df, invalid_rows)
+
+            return invalid_rows
+
+        # Register the check so it can also run through validate() and validate_file()
+        self._register(name, find_invalid, columns=columns, function=callable(custom_logic))
+
+        def decorator(func):
+            return self._wrap(func, find_invalid, name)
+
+        return decorator
+
+    def validate(self, df):
+        """
+        Runs every registered check on the data without calling a decorated function.
+
+        Args:
+            df: The data to validate (pandas DataFrame, pyarrow Table, Polars DataFrame or LazyFrame).
+
+        Returns:
+            dict: The invalid rows of each check as pandas DataFrames, keyed by validation name.
+        """
+        backend = self._get_backend(df)
+        df = backend.prepare(df)
+
+        return {name: self._run_check(name, df, backend) for name in self._checks}
+
+    def validate_file(self, source, file_format=None, **read_options):
+        """
+        Runs every registered check on a file or dataset directory, reading only the columns the checks use.
+        For Parquet sources, range checks read only the row groups whose min/max statistics allow a violation.
+
+        Args:
+            source (str): Path to a Parquet or CSV file, or a directory of Parquet files.
+            file_format (str, optional): Explicit format. Options are 'parquet', 'csv'. If None, it is inferred
+                from the file extension.
+            **read_options: Extra options passed to pandas.read_csv for single CSV files.
+
+        Returns:
+            dict: The invalid rows of each check as pandas DataFrames, keyed by validation name.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        file_format = detect_format(source, file_format)
+        results = {}
+
+        # Range checks on Parquet push their condition down to the reader, which skips row groups by statistics
+        pushdown = {}
+        if file_format == "parquet":
+            pushdown = {name: check for name, check in self._checks.items() if check["borders"] is not None}
+        for name, check in pushdown.items():
+            df = read_out_of_range(source, check["columns"][0], check["borders"],
+                                   columns=self._columns_for([check]), file_format=file_format)
+            backend = self._file_backend(check, df)
+            results[name] = self._run_check(name, backend.prepare(df), backend)
+
+        # Remaining checks share a single read of the columns they need, converted once per backend
+        remaining = [name for name in self._checks if name not in pushdown]
+        if remaining:
+            df = read_columns(source, columns=self._columns_for([self._checks[name] for name in remaining]),
+                              file_format=file_format, **read_options)
+            prepared = {}
+            for name in remaining:
+                backend = self._file_backend(self._checks[name], df)
+                if backend.name not in prepared:
+                    prepared[backend.name] = backend.prepare(df)
+                results[name] = self._run_check(name, prepared[backend.name], backend)
+
+        # Return the results in registration order
+        return {name: results[name] for name in self._checks}
+
+    def _file_backend(self, check, df):
+        """
+        Returns the backend running a check on data read by validate_file().
+        With 'auto', checks run on the type of the data read, except custom functions, which get a pandas DataFrame
+        like in most decorated calls.
+
+        Args:
+            check (dict): The registered check.
+            df: The data read from the file (pandas DataFrame or pyarrow Table).
+
+        Returns:
+            Backend: The backend instance.
+        """
+        if self.backend != "auto":
+            return get_backend(self.backend)
+        if check["function"]:
+            return get_backend("pandas")
+        return detect_backend(df)
+
+    def _infer_type(self, name, df, column, backend):
+        """
+        Infers whether a column is 'continuous' or 'discrete' from its distinct count.
+        The decision is cached per validation, column and column type, so it is only computed once.
+
+        Args:
+            name (str): The name of the validation.
+            df: The data being validated.
+            column (str): The column to inspect.
+            backend (Backend): The backend of the data.
+
+        Returns:
+            str: 'continuous' or 'discrete'.
+        """
+        key = (name, column, backend.dtype(df, column))
+        if key not in self._inferred_types:
+            # Heuristic: If the number of unique values is less than 5% of total, treat as discrete
+            if backend.is_low_cardinality(df, column, 0.05):
+                self._inferred_types[key] = 'discrete'
+            else:
+                self._inferred_types[key] = 'continuous'
+        return self._inferred_types[key]
+
+    def _register(self, name, find_invalid, columns=None, borders=None, function=False):
+        """
+        Records a check so it can run outside of a decorated function.
+
+        Args:
+            name (str): The name of the validation. A later check with the same name replaces the earlier one.
+            find_invalid (callable): Function returning the invalid rows of the data, given the data and its backend.
+            columns (list, optional): The columns used by the check. None means all columns.
+            borders (list, optional): The ranges of a range check, used for row group skipping.
+            function (bool): Whether the check calls a user function, which expects a specific data type.
+        """
+        self._checks[name] = {"find_invalid": find_invalid, "columns": columns, "borders": borders,
+                              "function": function}
+
+    def _columns_for(self, checks):
+        """
+        Returns the columns needed by a list of checks, including the identifier, or None if all are needed.
+        """
+        columns = [self.identifier] if self.identifier else []
+        for check in checks:
+            if check["columns"] is None:
+                return None
+            columns += [column for column in check["columns"] if column not in columns]
+        return columns
+
+    def _run_check(self, name, df, backend):
+        """
+        Runs one registered check on prepared data and logs the invalid rows if storing is enabled.
+
+        Returns:
+            pd.DataFrame: The invalid rows.
+        """
+        invalid_rows = backend.to_pandas(self._checks[name]["find_invalid"](df, backend))
+
+        # Save the invalid rows if any exist and storing is enabled
+        if not invalid_rows.empty and self.store:
+            self._log(invalid_rows, name)
+
+        return invalid_rows
+
+    def _wrap(self, func, find_invalid, name):
+        """
+        Wraps a function so that the validation runs before it is called.
+        Coroutine functions get an async wrapper that runs the validation in an executor.
+
+        Args:
+            func (callable): The function being decorated.
+            find_invalid (callable): Function returning the invalid rows of the data, given the data and its backend.
+            name (str): The name of the validation for logging purposes.
+
+        Returns:
+            function: The wrapped function.
+        """
+
+        def validate(df):
+            backend = self._get_backend(df)
+            invalid_rows = find_invalid(backend.prepare(df), backend)
+
+            # Save the invalid rows if any exist and storing is enabled
+            if backend.num_rows(invalid_rows) and self.store:
+                self._log(backend.to_pandas(invalid_rows), name)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(df, *args, **kwargs_func):
+                # asyncio is imported here, where a loop is already running, to keep it out of the package import
+                import asyncio
+
+                # Run the CPU-bound checks off the event loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, validate, df)
+
+                # Await the wrapped coroutine with the original arguments
+                return await func(df, *args, **kwargs_func)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(df, *args, **kwargs_func):
+            validate(df)
+
+            # Execute the wrapped function with the original arguments
+            return func(df, *args, **kwargs_func)
+
+        return wrapper
+
+    def _get_backend(self, df):
+        """
+        Returns the execution backend for the data, detecting it from the data type if the validator uses 'auto'.
+
+        Args:
+            df: The data being validated (pandas DataFrame, pyarrow Table, Polars DataFrame or LazyFrame).
+
+        Returns:
+            Backend: The backend instance.
+        """
+        if self.backend == "auto":
+            return detect_backend(df)
+        return get_backend(self.backend)
+
+    def flush(self):
+        """
+        Blocks until all validation results queued for the background writer have been written.
+
+        Raises:
+            Exception: The first error raised while writing in the background since the last flush.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """
+        Flushes pending validation results and stops the background writer.
+        """
+        if self._writer is not None:
+            self._writer.close()
+
+    def _log(self, outliers, name):
+        """
+        Hands the outliers to the background writer if enabled, otherwise saves them immediately.
+
+        Args:
+            outliers (pd.DataFrame): DataFrame containing the outliers.
+            name (str): The name of the validation for logging purposes.
+        """
+        if self._writer is not None:
+            self._writer.submit((outliers, name))
+        else:
+            self._save(outliers, name)
+
+    def _save(self, outliers, name):
+        """
+        Saves the outliers to a file based on the validator settings.
+
+        Args:
+            outliers (pd.DataFrame): DataFrame containing the outliers.
+            name (str): The name of the validation for logging purposes.
+        """
+        self._save_batch([(outliers, name)])
+
+    def _save_batch(self, batch):
+        """
+        Saves several sets of outliers at once, writing each target file only one time.
+
+        Args:
+            batch (list): A list of (outliers, name) tuples.
+        """
+        # Async calls and scheduler threads can save at the same time; the united log is read, extended and
+        # rewritten here, so concurrent saves are serialized to not lose each other's rows
+        with self._save_lock:
+            tagged = []
+            for outliers, name in batch:
+                # Create a copy of the outliers DataFrame to avoid modifying the original
+                outliers = outliers.copy()
+
+                # Add a new column to track the name of the validation that generated the outliers
+                outliers["Validation Name"] = name
+                if self.identifier:
+                    outliers = outliers[[self.identifier, "Validation Name"]]
+                tagged.append((outliers, name))
+
+            # Add the outliers to the indexed log store, if one is configured. Rows are tagged with the log file they
+            # are written to, so ingesting the log directory later replaces them instead of adding them twice
+            if self.log_store is not None:
+                for outliers, name in tagged:
+                    log_name = "log" if self.united else name
+                    source = os.path.abspath(os.path.join(self._path, f"{log_name}.{self.file_type}"))
+                    self.log_store.append(outliers, name=name, identifier=self.identifier, source=source)
+
+            # In the bitmap layout, OR the failed checks of each identifier into the existing bitmap
+            if self.layout == "bitmap":
+                new_outliers = pd.concat([outliers for outliers, name in tagged], ignore_index=True)
+                bitmap, checks = encode_violations(new_outliers, self.identifier, self._check_names)
+                self._check_names = checks["Validation Name"].tolist()
+                self._all_validations_df = merge_bitmaps(self._all_validations_df, bitmap, self.identifier)
+                # Save the bitmap to 'log' and the bit positions to 'log_checks' in the specified path
+                self._save_file(self._all_validations_df, os.path.join(self._path, "log"))
+                self._save_file(checks, os.path.join(self._path, "log_checks"))
+
+            # If united is True, concatenate the outliers with the existing DataFrame of all validations
+            elif self.united:
+                all_outliers = [outliers for outliers, name in tagged]
+                self._all_validations_df = pd.concat([self._all_validations_df] + all_outliers, ignore_index=True)
+                # Save the combined DataFrame to a file named 'log' in the specified path
+                self._save_file(self._all_validations_df, os.path.join(self._path, "log"))
+            else:
+                # Save the outliers DataFrame to a file named after the validation name, keeping the latest result
+                latest = {name: outliers for outliers, name in tagged}
+                for name, outliers in latest.items():
+                    self._save_file(outliers, os.path.join(self._path, f"{name}"))
+
+    def _save_file(self, df, file_name):
+        """
+        Saves a DataFrame to a file in the specified format.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to save.
+            file_name (str): The path and base name of the file.
+
+        Raises:
+            ValueError: If the specified file type is not supported.
+        """
+        # Check the file type and save the DataFrame accordingly
+        if self.file_type == "csv":
+            df.to_csv(f"{file_name}.csv", index=False, encoding='utf-8')
+        elif self.file_type == "xlsx":
+            df.to_excel(f"{file_name}.xlsx", index=False)
+        elif self.file_type == "pkl":
+            df.to_pickle(f"{file_name}.pkl")
+        elif self.file_type == "txt":
+            with open(f"{file_name}.txt", "w") as log:
+                df.to_string(log)
+                log.write("\n")
+        else:
+            # Raise an error if the file type is not supported
+            raise ValueError("Unsupported file type. Supported types are: 'csv', 'xlsx', 'pkl', 'txt'")
@@ -0,0 +1,400 @@
+from collections import deque
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import queue
+import random
+import threading
+import time
+
+
+class CronSchedule:
+
+    # Allowed range of each field: minute, hour, day of month, month, day of week (0 or 7 is Sunday)
+    _RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression):
+        """
+        Five-field cron expression ('minute hour day month weekday').
+        Fields accept '*', numbers, ranges ('1-5'), steps ('*/15', '0-30/10') and comma-separated lists.
+
+        Args:
+            expression (str): The cron expression.
+
+        Raises:
+            TypeError: If the expression is not a string.
+            ValueError: If the expression is malformed.
+        """
+        if not isinstance(expression, str):
+            raise TypeError("The 'cron' argument must be a string.")
+
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError("The 'cron' argument must have five fields: minute hour day month weekday.")
+
+        self.expression = expression  # The original expression
+        self.minutes, self.hours, self.days, self.months, weekdays = [
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self._RANGES)
+        ]
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+
+        # Like cron, the day of month and day of week must both match, unless both are restricted: then either one
+        # matching is enough. A field starting with '*' (including steps like '*/2') is not restricted
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    @staticmethod
+    def _parse(field, low, high):
+        """
+        Expands one cron field into the set of values it matches.
+        """
+        values = set()
+        for part in field.split(","):
+            part_range, _, step = part.partition("/")
+            if part_range == "*":
+                start, end = low, high
+            elif "-" in part_range:
+                start, end = (int(value) for value in part_range.split("-", 1))
+            else:
+                start = end = int(part_range)
+                if step:
+                    end = high
+
+            step = int(step) if step else 1
+            if not (low <= start <= end <= high) or step < 1:
+                raise ValueError(f"Invalid cron field '{field}'.")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment):
+        day_matches = moment.day in self.days
+        weekday_matches = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
+
+    def next_after(self, moment):
+        """
+        Returns the first matching minute strictly after the given moment.
+
+        Args:
+            moment (datetime): The reference time.
+
+        Returns:
+            datetime: The next run time.
+
+        Raises:
+            ValueError: If the expression never matches (e.g., February 30th).
+        """
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+
+        # Skip whole months, days and hours that cannot match before checking minutes
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+
+        raise ValueError(f"The cron expression '{self.expression}' never matches.")
+
+
+class ScheduledJob:
+
+    def __init__(self, name, func, interval=None, cron=None, priority=0, jitter=0.0, database=None):
+        """
+        A validation run by ValidationScheduler.
+
+        Args:
+            name (str): Unique name of the job.
+            func (callable): Function performing the validation.
+            interval (float, optional): Seconds between runs.
+            cron (CronSchedule, optional): Cron schedule of the runs.
+            priority (int): Higher priorities run first when several jobs are due.
+            jitter (float): Maximum random delay in seconds added to each run.
+            database (str, optional): Key of the database the job queries, used for concurrency limits.
+        """
+        self.name = name  # Unique name of the job
+        self.func = func  # Function performing the validation
+        self.interval = interval  # Seconds between runs
+        self.cron = cron  # Cron schedule of the runs
+        self.priority = priority  # Higher priorities run first
+        self.jitter = jitter  # Maximum random delay in seconds
+        self.database = database  # Database key for concurrency limits
+
+        self.planned = None  # Nominal time of the next run, without jitter, as a time.time() timestamp
+        self.next_run = None  # Dispatch time of the next run, i.e. planned plus jitter
+        self.running = False  # Whether a run is in progress
+        self.runs = 0  # Number of completed runs
+        self.skipped = 0  # Number of runs skipped because the previous one was still running
+        self.failures = 0  # Number of runs that raised an exception
+        self.last_error = None  # Exception raised by the latest failed run
+        self.last_result = None  # Return value of the latest successful run
+        self.removed = False  # Whether the job was removed from the scheduler
+
+    def schedule_next(self, now):
+        """
+        Plans the first run after the given timestamp and draws its jitter.
+        Runs are planned from the nominal time of the previous run, not from its jittered dispatch time, so the
+        random offsets do not add up over many runs.
+        """
+        previous = self.planned if self.planned is not None else now
+        if self.cron is not None:
+            self.planned = self.cron.next_after(datetime.fromtimestamp(max(previous, now))).timestamp()
+        else:
+            self.planned = previous + self.interval
+
+            # After a delay longer than the interval, skip the missed runs but keep the phase
+            if self.planned <= now:
+                self.planned += ((now - self.planned) // self.interval + 1) * self.interval
+
+        self.next_run = self.planned + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+
+class ValidationScheduler:
+
+    def __init__(self, max_workers=4, max_per_database=2):
+        """
+        Runs validators or single checks on a schedule with a bounded pool of worker threads.
+        Validators keep their engines and log writers between runs, so connections and log sinks are reused.
+
+        Args:
+            max_workers (int): Number of worker threads, i.e. the maximum number of concurrent runs.
+            max_per_database (int): Maximum number of concurrent runs against the same database.
+
+        Raises:
+            ValueError: If any of the input arguments is not a positive integer.
+        """
+
+        # Validate input arguments
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("The 'max_workers' argument must be a positive integer.")
+        if not isinstance(max_per_database, int) or max_per_database < 1:
+            raise ValueError("The 'max_per_database' argument must be a positive integer.")
+
+        self.max_workers = max_workers  # Number of worker threads
+        self.max_per_database = max_per_database  # Concurrent runs allowed per database
+
+        self._jobs = {}  # Jobs by name
+        self._timeline = []  # Heap of (next_run, sequence, job) of scheduled jobs
+        self._ready = queue.PriorityQueue()  # Due jobs ordered by priority, then by due time
+        self._sequence = itertools.count()  # Tie breaker keeping heap and queue entries comparable
+        self._condition = threading.Condition()  # Guards the timeline and wakes the dispatcher
+        self._database_lock = threading.Lock()  # Guards the per-database counters
+        self._database_running = {}  # Number of running jobs by database key
+        self._database_waiting = {}  # Jobs waiting for a database slot, by database key
+        self._threads = []
+        self._stopping = False
+
+    def add(self, target, *, name=None, every=None, cron=None, priority=0, jitter=0, checks=None, database=None):
+        """
+        Schedules a validator or a function.
+
+        Args:
+            target: A DatabaseValidator (its registered checks run on each run) or any callable without arguments.
+            name (str, optional): Unique name of the job. Defaults to the table or function name.
+            every (float or timedelta, optional): Interval between runs in seconds.
+            cron (str, optional): Five-field cron expression. Exactly one of every and cron is required.
+            priority (int): Higher priorities run first when several jobs are due.
+            jitter (float or timedelta): Maximum random delay added to each run, to spread load.
+            checks (list, optional): For validators, the validation names to run. If None, all checks run.
+            database (str, optional): Key of the database used for concurrency limits. Defaults to the URL of the
+                validator's engine, with the password masked; functions without a key are not limited.
+
+        Returns:
+            ScheduledJob: The scheduled job.
+
+        Raises:
+            TypeError: If input arguments are not of the expected type.
+            ValueError: If the schedule is invalid or the name is already used.
+        """
+
+        # Validate input types
+        if (every is None) == (cron is None):
+            raise ValueError("Exactly one of the 'every' and 'cron' arguments is required.")
+        if isinstance(every, timedelta):
+            every = every.total_seconds()
+        if isinstance(jitter, timedelta):
+            jitter = jitter.total_seconds()
+        if every is not None and (not isinstance(every, (int, float)) or every <= 0):
+            raise ValueError("The 'every' argument must be a positive number of seconds.")
+        if not isinstance(priority, int):
+            raise TypeError("The 'priority' argument must be an integer.")
+        if not isinstance(jitter, (int, float)) or jitter < 0:
+            raise ValueError("The 'jitter' argument must be a non-negative number of seconds.")
+
+        # Validators run their registered checks; their engine identifies the database
+        if hasattr(target, "validate") and hasattr(target, "engine"):
+            validator = target
+            func = lambda: validator.validate(checks)
+            name = name or getattr(validator, "table_name", None)
+            # Key on the URL without its password, since the key is visible through jobs()
+            database = database or validator.engine.url.render_as_string(hide_password=True)
+        elif callable(target):
+            func = target
+            name = name or getattr(target, "__name__", None)
+        else:
+            raise TypeError("The 'target' argument must be a DatabaseValidator or a callable (function).")
+
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must be a string.")
+
+        job = ScheduledJob(name, func, interval=every, cron=CronSchedule(cron) if cron is not None else None,
+                           priority=priority, jitter=float(jitter), database=database)
+
+        with self._condition:
+            if name in self._jobs:
+                raise ValueError(f"A job named '{name}' is already scheduled.")
+            self._jobs[name] = job
+            job.schedule_next(time.time())
+            heapq.heappush(self._timeline, (job.next_run, next(self._sequence), job))
+            self._condition.notify()
+
+        return job
+
+    def remove(self, name):
+        """
+        Unschedules a job. A run in progress is allowed to finish.
+
+        Args:
+            name (str): The name of the job.
+        """
+        with self._condition:
+            job = self._jobs.pop(name)
+            job.removed = True
+
+    def jobs(self):
+        """
+        Returns the scheduled jobs by name.
+        """
+        with self._condition:
+            return dict(self._jobs)
+
+    def start(self):
+        """
+        Starts the dispatcher and worker threads. Returns immediately.
+        """
+        if self._threads:
+            return
+        self._stopping = False
+        self._threads = [threading.Thread(target=self._dispatch, name="AlertManager-Scheduler", daemon=True)]
+        self._threads += [threading.Thread(target=self._work, name=f"AlertManager-Worker-{i}", daemon=True)
+                          for i in range(self.max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, wait=True):
+        """
+        Stops scheduling new runs. Runs in progress finish first.
+
+        Args:
+            wait (bool): Whether to block until the worker threads have exited.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for _ in range(self.max_workers):
+            self._ready.put((float("-inf"), 0, 0, None))
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def run_forever(self):
+        """
+        Starts the scheduler and blocks until interrupted (e.g., with Ctrl+C).
+        """
+        self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            self.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _dispatch(self):
+        """
+        Dispatcher thread: moves due jobs to the ready queue and schedules their next run.
+        """
+        with self._condition:
+            while not self._stopping:
+                now = time.time()
+                while self._timeline and self._timeline[0][0] <= now:
+                    due, _, job = heapq.heappop(self._timeline)
+                    if job.removed:
+                        continue
+
+                    # Overlap protection: skip this run if the previous one is still in progress
+                    if job.running:
+                        job.skipped += 1
+                    else:
+                        job.running = True
+                        self._ready.put((-job.priority, due, next(self._sequence), job))
+
+                    job.schedule_next(now)
+                    heapq.heappush(self._timeline, (job.next_run, next(self._sequence), job))
+
+                timeout = self._timeline[0][0] - now if self._timeline else None
+                self._condition.wait(timeout)
+
+    def _work(self):
+        """
+        Worker thread: runs ready jobs while respecting the per-database limit.
+        """
+        while True:
+            _, _, _, job = self._ready.get()
+            if job is None:
+                return
+
+            # Park the job if its database is at the limit; it is requeued when a slot frees up
+            if not self._acquire_database(job):
+                continue
+
+            try:
+                job.last_result = job.func()
+                job.last_error = None
+                job.runs += 1
+            except Exception as e:
+                job.last_error = e
+                job.failures += 1
+            finally:
+                job.running = False
+                self._release_database(job)
+
+    def _acquire_database(self, job):
+        """
+        Takes a database slot for the job, or parks it until one is released.
+        """
+        if job.database is None:
+            return True
+        with self._database_lock:
+            if self._database_running.get(job.database, 0) < self.max_per_database:
+                self._database_running[job.database] = self._database_running.get(job.database, 0) + 1
+                return True
+            self._database_waiting.setdefault(job.database, deque()).append(job)
+            return False
+
+    def _release_database(self, job):
+        """
+        Frees the job's database slot and requeues the next job waiting for it.
+        """
+        if job.database is None:
+            return
+        with self._database_lock:
+            self._database_running[job.database] -= 1
+            waiting = self._database_waiting.get(job.database)
+            if waiting:
+                next_job = waiting.popleft()
+                self._ready.put((-next_job.priority, next_job.planned, next(self._sequence), next_job))
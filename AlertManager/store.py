@@ -0,0 +1,230 @@
+from datetime import date, datetime
+import json
+import os
+import re
+import sqlite3
+import threading
+
+import pandas as pd
+
+from AlertManager.bitmap import decode_violations
+
+
+class LogStore:
+
+    def __init__(self, path="./validation_logs/log_store.db"):
+        """
+        Indexed store of validation results in a local SQLite file.
+        Results are indexed by validation name, identifier and date, so lookups and date range scans only read
+        the matching rows instead of every log file.
+
+        Args:
+            path (str): Path of the SQLite file. It is created if it doesn't exist.
+
+        Raises:
+            TypeError: If any of the input arguments are not of the expected type.
+        """
+
+        # Validate input types
+        if not isinstance(path, str):
+            raise TypeError("The 'path' argument must be a string.")
+
+        self.path = path  # Path of the SQLite file
+
+        # Create the directory if it doesn't exist
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # The connection is shared with the background writer thread, so access is serialized with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS violations (
+                    log_date TEXT NOT NULL,
+                    validation_name TEXT NOT NULL,
+                    identifier TEXT,
+                    record TEXT,
+                    source TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_violations_name ON violations (validation_name, log_date);
+                CREATE INDEX IF NOT EXISTS idx_violations_identifier ON violations (identifier, log_date);
+                CREATE INDEX IF NOT EXISTS idx_violations_date ON violations (log_date);
+                CREATE INDEX IF NOT EXISTS idx_violations_source ON violations (source);
+            """)
+
+    def append(self, df, name=None, identifier=None, log_date=None, source=None, replace=False):
+        """
+        Adds validation results to the store.
+
+        Args:
+            df (pd.DataFrame): The invalid rows. A 'Validation Name' column is used if name is not given.
+            name (str, optional): The name of the validation.
+            identifier (str, optional): Column holding the row identifier. Without it, each row is stored as JSON.
+            log_date (date or str, optional): The date of the results. Defaults to today.
+            source (str, optional): The log file of the results, used to replace them on re-ingestion. Validators
+                pass the absolute path of the file they write to.
+            replace (bool): Whether to delete the earlier results of the same source first.
+
+        Raises:
+            ValueError: If neither name nor a 'Validation Name' column is available.
+        """
+        if name is None and "Validation Name" not in df.columns:
+            raise ValueError("Either 'name' or a 'Validation Name' column is required.")
+
+        log_date = self._to_date(log_date or date.today())
+        names = [name] * len(df) if name is not None else df["Validation Name"].astype(str).tolist()
+        record_columns = [column for column in df.columns if column != "Validation Name"]
+
+        if identifier is not None and identifier in df.columns:
+            identifiers = df[identifier].astype(str).tolist()
+            records = [None] * len(df)
+        else:
+            identifiers = [None] * len(df)
+            records = df[record_columns].to_json(orient="records", date_format="iso", lines=True).splitlines() \
+                if len(df) else []
+
+        rows = list(zip([log_date] * len(df), names, identifiers, records, [source] * len(df)))
+        with self._lock, self._conn:
+            # Re-ingesting a file replaces its earlier rows in the same transaction, so readers never see both
+            if replace:
+                self._conn.execute("DELETE FROM violations WHERE source = ?", (source,))
+            self._conn.executemany(
+                "INSERT INTO violations (log_date, validation_name, identifier, record, source) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def ingest(self, path, identifier=None):
+        """
+        Loads the log files written by the validators into the store.
+        Day directories ('YYYY-MM-DD') created with history=True are dated by their name, other files by their
+        modification date. Re-ingesting a file replaces its earlier results, including those a validator with this
+        log_store appended while writing the file, so nothing is counted twice. Text logs ('txt') cannot be parsed
+        and are skipped.
+
+        Args:
+            path (str): The log directory of a validator.
+            identifier (str, optional): Column holding the row identifier.
+
+        Returns:
+            int: The number of files ingested.
+        """
+        ingested = 0
+        for directory, _, file_names in os.walk(path):
+            day = os.path.basename(directory)
+            for file_name in sorted(file_names):
+                full_name = os.path.join(directory, file_name)
+                base_name, extension = os.path.splitext(file_name)
+                if extension not in (".pkl", ".csv", ".xlsx") or base_name.startswith("."):
+                    continue
+
+                # Bit position tables are read together with their bitmap log
+                if base_name.endswith("_checks") and base_name[:-len("_checks")] + extension in file_names:
+                    continue
+
+                if re.fullmatch(r"\d{4}-\d{2}-\d{2}", day):
+                    log_date = day
+                else:
+                    log_date = datetime.fromtimestamp(os.path.getmtime(full_name)).date()
+
+                df = self._read(full_name, extension)
+
+                # Expand bitmap logs back to one row per failed check
+                if "Failed Checks" in df.columns:
+                    checks = self._read(os.path.join(directory, f"{base_name}_checks{extension}"), extension)
+                    key = identifier if identifier in df.columns else df.columns[0]
+                    df = decode_violations(df, checks, key)
+
+                # Separate logs hold one validation each and are named after it
+                name = None if "Validation Name" in df.columns else base_name
+
+                # Replace earlier rows of this file, including the ones a validator appended while writing it
+                self.append(df, name=name, identifier=identifier, log_date=log_date,
+                            source=os.path.abspath(full_name), replace=True)
+                ingested += 1
+
+        return ingested
+
+    def query(self, name=None, identifier=None, start=None, end=None):
+        """
+        Returns stored validation results matching all given filters.
+
+        Args:
+            name (str, optional): The name of the validation.
+            identifier (optional): The row identifier. Compared as a string.
+            start (date or str, optional): First date to include.
+            end (date or str, optional): Last date to include.
+
+        Returns:
+            pd.DataFrame: Matching results with 'Date', 'Validation Name', 'Identifier' and 'Record' columns.
+        """
+        where, parameters = self._where(name, identifier, start, end)
+        sql = f"SELECT log_date, validation_name, identifier, record FROM violations{where} ORDER BY log_date, rowid"
+
+        with self._lock:
+            rows = self._conn.execute(sql, parameters).fetchall()
+
+        df = pd.DataFrame(rows, columns=["Date", "Validation Name", "Identifier", "Record"])
+        df["Record"] = df["Record"].map(lambda record: json.loads(record) if record is not None else None)
+        return df
+
+    def has_failed(self, identifier, name=None, start=None, end=None):
+        """
+        Returns True if the identifier failed any check (or the named check) between start and end.
+        Stops at the first matching result.
+        """
+        where, parameters = self._where(name, identifier, start, end)
+        sql = f"SELECT 1 FROM violations{where} LIMIT 1"
+        with self._lock:
+            return self._conn.execute(sql, parameters).fetchone() is not None
+
+    def close(self):
+        """
+        Closes the SQLite connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def _where(self, name, identifier, start, end):
+        """
+        Builds the WHERE clause and parameters for the given filters.
+        """
+        conditions, parameters = [], []
+        if name is not None:
+            conditions.append("validation_name = ?")
+            parameters.append(name)
+        if identifier is not None:
+            conditions.append("identifier = ?")
+            parameters.append(str(identifier))
+        if start is not None:
+            conditions.append("log_date >= ?")
+            parameters.append(self._to_date(start))
+        if end is not None:
+            conditions.append("log_date <= ?")
+            parameters.append(self._to_date(end))
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, parameters
+
+    @staticmethod
+    def _to_date(value):
+        """
+        Converts a date, datetime or ISO string to a 'YYYY-MM-DD' string.
+        """
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        return date.fromisoformat(str(value)[:10]).isoformat()
+
+    @staticmethod
+    def _read(file_name, extension):
+        """
+        Reads a log file written by a validator.
+        """
+        if extension == ".pkl":
+            return pd.read_pickle(file_name)
+        if extension == ".csv":
+            return pd.read_csv(file_name)
+        return pd.read_excel(file_name)
@@ -0,0 +1,185 @@
+import atexit
+import itertools
+import os
+import pickle
+import queue
+import threading
+import time
+
+
+class LogWriter:
+
+    _STOP = object()
+
+    def __init__(self, handler, queue_size=1000, backpressure="block", spill_path=None, batch_size=100):
+        """
+        Background writer that hands validation results to a handler on a separate thread.
+
+        Args:
+            handler (callable): Function receiving a list of queued items and writing them out.
+            queue_size (int): Maximum number of items waiting to be written.
+            backpressure (str): What to do when the queue is full. Options are 'block', 'drop', 'spill'.
+            spill_path (str, optional): Directory used for overflow items when backpressure is 'spill'.
+            batch_size (int): Maximum number of queued items handed to the handler in one call.
+
+        Raises:
+            TypeError: If any of the input arguments are not of the expected type.
+            ValueError: If an invalid value is provided for 'backpressure' or 'queue_size'.
+        """
+
+        # Validate input arguments
+        if not callable(handler):
+            raise TypeError("The 'handler' argument must be a callable (function).")
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("The 'queue_size' argument must be a positive integer.")
+        if not isinstance(backpressure, str) or backpressure.lower() not in ['block', 'drop', 'spill']:
+            raise ValueError("The 'backpressure' argument must be one of 'block', 'drop', or 'spill'.")
+        if backpressure.lower() == "spill" and not spill_path:
+            raise ValueError("The 'spill_path' argument is required when backpressure is 'spill'.")
+
+        self.handler = handler  # Function that performs the actual write
+        self.backpressure = backpressure.lower()  # Policy applied when the queue is full
+        self.spill_path = spill_path  # Directory for overflow items
+        self.batch_size = batch_size  # Maximum items per handler call
+        self.dropped = 0  # Number of items discarded under the 'drop' policy
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()  # Serializes handler calls between the thread and flush()
+        self._replay_lock = threading.Lock()  # Prevents spilled items from being replayed twice
+        self._error = None  # First exception raised by the handler, re-raised on flush()
+        self._spill_ids = itertools.count(1)  # Keeps spill file names unique and ordered
+        self._state_lock = threading.Lock()  # Makes the closed check and the put atomic with respect to close()
+        self._closed = False
+
+        # Start the writer thread and make sure pending results are written on interpreter exit
+        self._thread = threading.Thread(target=self._run, name="AlertManager-LogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, item):
+        """
+        Places an item on the queue, applying the configured backpressure policy if it is full.
+
+        Args:
+            item: The item to hand to the handler.
+
+        Raises:
+            RuntimeError: If the writer has already been closed.
+        """
+        # Holding the lock while a full queue blocks is safe: the writer thread drains it without taking the lock
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("The log writer has been closed.")
+
+            if self.backpressure == "block":
+                self._queue.put(item)
+                return
+
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                if self.backpressure == "drop":
+                    self.dropped += 1
+                else:
+                    self._spill(item)
+
+    def flush(self):
+        """
+        Blocks until every submitted item, including spilled ones, has been written.
+
+        Raises:
+            Exception: The first error raised by the handler since the last flush.
+        """
+        self._queue.join()
+        self._replay_spill()
+
+        # Surface background failures to the caller
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Flushes pending items and stops the writer thread. Safe to call more than once.
+        """
+        # Mark the writer closed first, so no submit can enqueue an item behind the stop sentinel
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        try:
+            self.flush()
+        finally:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            atexit.unregister(self.close)
+
+    def _run(self):
+        """
+        Writer thread loop: collects queued items into batches and passes them to the handler.
+        """
+        while True:
+            batch = [self._queue.get()]
+
+            # Drain whatever else is already waiting so the handler writes once per batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is self._STOP for item in batch)
+            items = [item for item in batch if item is not self._STOP]
+
+            if items:
+                self._handle(items)
+            for _ in batch:
+                self._queue.task_done()
+
+            # Write spilled items back once the queue has room again
+            if self._queue.empty():
+                self._replay_spill()
+
+            if stop:
+                return
+
+    def _handle(self, items):
+        """
+        Calls the handler, keeping the first error for flush() instead of killing the thread.
+        """
+        with self._lock:
+            try:
+                self.handler(items)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def _spill(self, item):
+        """
+        Pickles an item that did not fit in the queue to the spill directory.
+        """
+        if not os.path.exists(self.spill_path):
+            os.makedirs(self.spill_path)
+
+        file_name = os.path.join(self.spill_path, f"{time.time_ns()}-{next(self._spill_ids):08d}.spill")
+        with open(file_name, "wb") as spill:
+            pickle.dump(item, spill)
+
+    def _replay_spill(self):
+        """
+        Loads spilled items in the order they were written and hands them to the handler.
+        """
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return
+
+        with self._replay_lock:
+            file_names = sorted(f for f in os.listdir(self.spill_path) if f.endswith(".spill"))
+            for start in range(0, len(file_names), self.batch_size):
+                items = []
+                for file_name in file_names[start:start + self.batch_size]:
+                    full_name = os.path.join(self.spill_path, file_name)
+                    with open(full_name, "rb") as spill:
+                        items.append(pickle.load(spill))
+                    os.remove(full_name)
+                self._handle(items)
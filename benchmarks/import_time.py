@@ -0,0 +1,67 @@
+"""
+Measures the cold import time of AlertManager entry points.
+
+Each scenario runs in a fresh interpreter, several times, and the fastest run is reported together with the
+heavy dependencies it loaded. Run from the repository root:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+# Statements timed in a fresh interpreter
+SCENARIOS = {
+    'import AlertManager': 'import AlertManager',
+    'LocalValidator': 'from AlertManager import LocalValidator',
+    'DatabaseValidator': 'from AlertManager import DatabaseValidator',
+    'AlertManager.module (legacy)': 'from AlertManager.module import *',
+}
+
+# Dependencies reported when a scenario loads them
+HEAVY_MODULES = ['pandas', 'numpy', 'sqlalchemy', 'pyarrow', 'polars', 'asyncio', 'sqlite3']
+
+# Timing and module report printed by the child interpreter
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+
+def measure(statement, repeat):
+    """
+    Runs a statement in fresh interpreters and returns the fastest time in seconds and the heavy modules loaded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+
+    times, modules = [], ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                                capture_output=True, text=True).stdout.splitlines()
+        times.append(float(output[0]))
+        modules = output[1] if len(output) > 1 else ''
+    return min(times), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the cold import time of AlertManager.')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per scenario; the fastest is reported')
+    args = parser.parse_args()
+
+    print(f"{'Scenario':<32}{'Time (ms)':>12}  Loaded")
+    for label, statement in SCENARIOS.items():
+        elapsed, modules = measure(statement, args.repeat)
+        print(f"{label:<32}{elapsed * 1000:>12.1f}  {modules or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,10 @@ setup(
         'pandas',
         'numpy',
     ],
+    extras_require={
+        'arrow': ['pyarrow>=14'],
+        'polars': ['polars>=1.0'],
+    },
     project_urls={
         'Documentation': 'https://timeline-manager.readthedocs.io/en/latest/index.html',
         'HomePage': 'https://github.com/Qubdi/AlertManager',
@@ -32,5 +36,5 @@ setup(
         "License :: OSI Approved :: MIT License",  # License type
         "Operating System :: OS Independent",  # OS compatibility
     ],
-    python_requires='>=3.6',  # Specify the minimum Python version required
+    python_requires='>=3.7',  # Specify the minimum Python version required
 )